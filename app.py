@@ -509,7 +509,7 @@ class MainWindow(SmartMainWindow):
 
     def update_stats(self, results: TranslationManagerResults):
         """Update the statistics display."""
-        self.stats_widget.update_stats(results)
+        self.stats_widget.request_update_stats(results)
         self.update_project_time_display(results)
 
     def _format_display_time(self, dt: Optional[datetime]) -> str:
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List, Tuple, Dict
 
 from .translation_group import TranslationKey
@@ -43,6 +44,14 @@ class TranslationQualityFindings:
         return out
 
 
+def _sum_locales(locale_groups: List[Tuple[TranslationKey, List[str]]]) -> int:
+    """Total number of locales across (key, locales) groups."""
+    total = 0
+    for _key, locales in locale_groups:
+        total += len(locales)
+    return total
+
+
 @dataclass
 class InvalidTranslationGroups:
     """Container for all types of invalid translations found in a project.
@@ -69,17 +78,70 @@ class InvalidTranslationGroups:
                 len(self.invalid_newline_locale_groups) > 0 or
                 len(self.invalid_character_set_locale_groups) > 0)
 
+    # Per-category counts are computed on first access and then cached. A new instance is built
+    # for every analysis run, so the groups must be fully populated before any count is read.
+
+    @cached_property
+    def stale_count(self) -> int:
+        return len(self.not_in_base)
+
+    @cached_property
+    def missing_count(self) -> int:
+        return _sum_locales(self.missing_locale_groups)
+
+    @cached_property
+    def invalid_unicode_count(self) -> int:
+        return _sum_locales(self.invalid_unicode_locale_groups)
+
+    @cached_property
+    def invalid_indices_count(self) -> int:
+        return _sum_locales(self.invalid_index_locale_groups)
+
+    @cached_property
+    def invalid_braces_count(self) -> int:
+        return _sum_locales(self.invalid_brace_locale_groups)
+
+    @cached_property
+    def invalid_leading_space_count(self) -> int:
+        return _sum_locales(self.invalid_leading_space_locale_groups)
+
+    @cached_property
+    def invalid_newline_count(self) -> int:
+        return _sum_locales(self.invalid_newline_locale_groups)
+
+    @cached_property
+    def invalid_character_set_count(self) -> int:
+        return _sum_locales(self.invalid_character_set_locale_groups)
+
+    def compute_counts(self) -> None:
+        """Compute and cache every per-category count now rather than on first read.
+
+        Lets the thread that built the groups pay for the counting, so later readers (e.g. on
+        the UI thread) only get cached integers.
+        """
+        for name in (
+            'stale_count',
+            'missing_count',
+            'invalid_unicode_count',
+            'invalid_indices_count',
+            'invalid_braces_count',
+            'invalid_leading_space_count',
+            'invalid_newline_count',
+            'invalid_character_set_count',
+        ):
+            getattr(self, name)
+
     def get_total_errors(self) -> Dict[str, int]:
         """Get a count of all error types."""
         return {
-            'not_in_base': len(self.not_in_base),
-            'missing_translations': sum(len(locales) for _, locales in self.missing_locale_groups),
-            'invalid_unicode': sum(len(locales) for _, locales in self.invalid_unicode_locale_groups),
-            'invalid_indices': sum(len(locales) for _, locales in self.invalid_index_locale_groups),
-            'invalid_braces': sum(len(locales) for _, locales in self.invalid_brace_locale_groups),
-            'invalid_leading_spaces': sum(len(locales) for _, locales in self.invalid_leading_space_locale_groups),
-            'invalid_newlines': sum(len(locales) for _, locales in self.invalid_newline_locale_groups),
-            'invalid_character_set': sum(len(locales) for _, locales in self.invalid_character_set_locale_groups),
+            'not_in_base': self.stale_count,
+            'missing_translations': self.missing_count,
+            'invalid_unicode': self.invalid_unicode_count,
+            'invalid_indices': self.invalid_indices_count,
+            'invalid_braces': self.invalid_braces_count,
+            'invalid_leading_spaces': self.invalid_leading_space_count,
+            'invalid_newlines': self.invalid_newline_count,
+            'invalid_character_set': self.invalid_character_set_count,
         }
 
     def get_invalid_locales(self) -> List[str]:
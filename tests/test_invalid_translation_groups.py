@@ -158,3 +158,31 @@ class TestTranslationQualityFindings:
         counts = f.count_by_signal()
         assert counts[QualityHeuristicKind.IDENTICAL_TO_DEFAULT.value] == 2
         assert counts[QualityHeuristicKind.LATIN_IN_CJK_LOCALE.value] == 1
+
+
+class TestInvalidTranslationGroupsCachedCounts:
+    def test_counts_match_total_errors(self):
+        g = InvalidTranslationGroups()
+        g.not_in_base.append(_key("s"))
+        g.missing_locale_groups.append((_key("a"), ["fr", "de"]))
+        g.invalid_newline_locale_groups.append((_key("nl"), ["ko"]))
+        counts = g.get_total_errors()
+        assert g.stale_count == counts["not_in_base"] == 1
+        assert g.missing_count == counts["missing_translations"] == 2
+        assert g.invalid_newline_count == counts["invalid_newlines"] == 1
+        assert g.invalid_unicode_count == 0
+
+    def test_count_is_computed_once_per_instance(self):
+        g = InvalidTranslationGroups()
+        g.missing_locale_groups.append((_key("a"), ["fr"]))
+        assert g.missing_count == 1
+        g.missing_locale_groups.append((_key("b"), ["de"]))
+        assert g.missing_count == 1
+
+    def test_compute_counts_caches_every_count_up_front(self):
+        g = InvalidTranslationGroups()
+        g.missing_locale_groups.append((_key("a"), ["fr"]))
+        g.compute_counts()
+        g.missing_locale_groups.append((_key("b"), ["de"]))
+        assert g.missing_count == 1
+        assert g.stale_count == 0
@@ -0,0 +1,43 @@
+"""Tests for ui.locale_selection_window.validate_locale_code."""
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    import PyQt6  # noqa: F401
+    _HAS_PYQT6 = True
+except Exception:
+    _HAS_PYQT6 = False
+
+from utils.translations import I18N
+
+_ = I18N._
+
+
+@pytest.mark.skipif(not _HAS_PYQT6, reason="PyQt6 not installed in this environment")
+class TestValidateLocaleCode:
+    @pytest.mark.parametrize("code", ["en", "EN", "pt_BR", "zh_CN_Hans", "sr_RS_Latn"])
+    def test_accepts_well_formed_known_codes(self, code):
+        from ui.locale_selection_window import validate_locale_code
+
+        assert validate_locale_code(code) is None
+
+    @pytest.mark.parametrize(
+        "code, message",
+        [
+            ("eng", "Language code must be a two-letter ISO 639-1 code"),
+            ("", "Language code must be a two-letter ISO 639-1 code"),
+            ("qq", "Invalid language code. Must be a valid ISO 639-1 code"),
+            ("en_us", "Country code must be a two-letter uppercase ISO 3166-1 code"),
+            ("en_QQ", "Invalid country code. Must be a valid ISO 3166-1 code"),
+            ("zh_CN_hans", "Script code must be a four-letter code with first letter uppercase"),
+            ("zh_CN_Qqqq", "Invalid script code. Must be a valid ISO 15924 code"),
+        ],
+    )
+    def test_reports_the_specific_problem(self, code, message):
+        from ui.locale_selection_window import validate_locale_code
+
+        assert validate_locale_code(code) == _(message)
@@ -167,6 +167,25 @@ class TestExportOutstandingToTsv:
         assert "farewell" in md_text
         assert "Missing locales: es" in md_text
 
+    def test_repeated_locales_are_listed_once(self, tmp_path):
+        from ui.translation_windows.outstanding_items import tsv_export
+
+        locales = ["en", "es", "es"]
+        current_invalid_groups = self._make_current_invalid_groups(locales)
+        out_path = tmp_path / "outstanding.tsv"
+
+        with patch(
+            "ui.translation_windows.outstanding_items.tsv_export.QFileDialog"
+        ) as mock_dialog, patch.object(QMessageBox, "information"), patch.object(
+            QMessageBox, "critical"
+        ) as mock_critical:
+            mock_dialog.getSaveFileName.return_value = (str(out_path), "TSV Files (*.tsv)")
+            tsv_export.export_outstanding_to_tsv(None, current_invalid_groups, str(tmp_path), locales)
+
+        mock_critical.assert_not_called()
+        row = out_path.read_text(encoding="utf-8").splitlines()[1].split("\t")
+        assert row[3] == "es"
+
     def test_default_save_path_is_under_the_project_directory(self, tmp_path):
         from ui.translation_windows.outstanding_items import tsv_export
 
@@ -102,6 +102,44 @@ class TestLoadData(_OutstandingItemsWindowTestBase):
         assert self.window.table.rowCount() == 1
         assert self.window._get_key_from_row(0) == missing.key
 
+    def test_rows_past_the_eager_count_are_built_on_demand(self):
+        from ui.translation_windows.outstanding_items.window import EAGER_POPULATE_ROW_COUNT
+
+        groups = [
+            _make_group(f"key.{i}", {"en": f"Text {i}", "es": ""})
+            for i in range(EAGER_POPULATE_ROW_COUNT + 5)
+        ]
+        translations = {g.key: g for g in groups}
+
+        self.window.load_data(translations, ["en", "es"])
+
+        last_row = len(groups) - 1
+        assert self.window.table.rowCount() == len(groups)
+        assert self.window.table.item(EAGER_POPULATE_ROW_COUNT - 1, 0) is not None
+        assert self.window.table.item(last_row, 0) is None
+        # Reading a key from an unbuilt row flushes the rest of the table first
+        assert self.window._get_key_from_row(last_row) == groups[-1].key
+        assert self.window.table.item(last_row, self._col_for_locale("es")) is not None
+
+    def test_deferred_rows_keep_cells_filled_before_they_were_built(self):
+        from ui.translation_windows.outstanding_items.window import EAGER_POPULATE_ROW_COUNT
+        from PyQt6.QtWidgets import QTableWidgetItem
+
+        groups = [
+            _make_group(f"key.{i}", {"en": f"Text {i}", "es": ""})
+            for i in range(EAGER_POPULATE_ROW_COUNT + 5)
+        ]
+        translations = {g.key: g for g in groups}
+        self.window.load_data(translations, ["en", "es"])
+        last_row = len(groups) - 1
+        es_col = self._col_for_locale("es")
+
+        self.window.table.setItem(last_row, es_col, QTableWidgetItem("Typed early"))
+        self.window._flush_pending_rows()
+
+        assert self.window.table.item(last_row, es_col).text() == "Typed early"
+        assert self.window._get_key_from_row(last_row) == groups[-1].key
+
     def test_skips_groups_not_in_base(self):
         orphan = _make_group("orphan", {"en": "Bye", "es": ""}, is_in_base=False)
         translations = {orphan.key: orphan}
@@ -139,6 +177,24 @@ class TestLoadData(_OutstandingItemsWindowTestBase):
         assert outstanding.get_translation("es") == "Guardar"
         assert self.window._prefill.pending_prefill_update_count() == 1
 
+    def test_combine_yes_drops_resolved_prefilled_key_and_keeps_others(self):
+        existing = _make_group("existing.key", {"en": "Save", "es": "Guardar"})
+        outstanding = _make_group("outstanding.key", {"en": "Save", "es": ""})
+        other = _make_group("other.key", {"en": "Other", "es": ""})
+        translations = {existing.key: existing, outstanding.key: outstanding, other.key: other}
+
+        with patch(
+            "ui.translation_windows.outstanding_items.window.ask_combine_duplicates",
+            return_value="yes",
+        ):
+            has_items = self.window.load_data(translations, ["en", "es"])
+
+        # Only the pre-filled key is revalidated; untouched outstanding keys stay listed.
+        assert has_items is True
+        assert outstanding.get_translation("es") == "Guardar"
+        assert list(self.window._current_invalid_groups) == [other.key]
+        assert self.window.table.rowCount() == 1
+
     def test_combine_yes_groups_outstanding_duplicates_into_one_row(self):
         dup1 = _make_group("dup.one", {"en": "Hello", "es": ""})
         dup2 = _make_group("dup.two", {"en": "Hello", "es": ""})
@@ -254,6 +310,48 @@ class TestSaveChanges(_OutstandingItemsWindowTestBase):
         mock_close.assert_not_called()
         assert self.window.table.rowCount() == 1
 
+    def test_without_parent_defers_table_reload_until_shown_when_hidden(self):
+        done = _make_group("done", {"en": "Done", "es": ""})
+        pending = _make_group("pending", {"en": "Pending", "es": ""})
+        translations = {done.key: done, pending.key: pending}
+        self.window.load_data(translations, ["en", "es"])
+        self.window.table.item(0, self._col_for_locale("es")).setText("Hecho")
+
+        def apply_update(locale, changes):
+            for key, value in changes:
+                translations[key].add_translation(locale, value)
+
+        self.window.translation_updated.connect(apply_update)
+        assert not self.window.isVisible()
+
+        with patch.object(self.window, "close") as mock_close:
+            self.window.save_changes()
+
+        mock_close.assert_not_called()
+        assert list(self.window._current_invalid_groups) == [pending.key]
+        assert self.window.table.rowCount() == 2  # hidden: table not rebuilt yet
+
+        self.window.show()
+        try:
+            assert self.window.table.rowCount() == 1
+            assert self.window._get_key_from_row(0) == pending.key
+        finally:
+            self.window.hide()
+
+    def test_rebuilds_translation_service_only_after_it_was_used(self):
+        missing = _make_group("farewell", {"en": "Bye", "es": ""})
+        translations = {missing.key: missing}
+        self.window.load_data(translations, ["en", "es"])
+        service = self.window.translation_service
+
+        self.window.save_changes()
+        assert self.window.translation_service is service
+
+        self.window._on_translation_finished()
+        self.window.save_changes()
+        assert self.window.translation_service is not service
+        assert not self.window._translation_service_dirty
+
     def test_with_parent_always_closes_and_defers_to_parent_batch_processing(self):
         from ui.translation_windows.outstanding_items.window import OutstandingItemsWindow
 
@@ -484,6 +582,26 @@ class TestFillRowMissingWithDefaultTranslation(_OutstandingItemsWindowTestBase):
         mock_info.assert_called_once()
 
 
+class TestUnicodeDisplayToggle(_OutstandingItemsWindowTestBase):
+    def test_toggle_rewrites_stored_values_and_keeps_typed_missing_cells(self):
+        from i18n.translation_group import escape_unicode
+
+        group = _make_group("cafe", {"en": "Cafe", "es": "", "fr": "Café"})
+        self.window.load_data({group.key: group}, ["en", "es", "fr"])
+        es_col = self._col_for_locale("es")
+        fr_col = self._col_for_locale("fr")
+        self.window.table.item(0, es_col).setText("typed")
+
+        self.window.toggle_unicode_display()
+
+        assert self.window.table.item(0, fr_col).text() == escape_unicode("Café")
+        assert self.window.table.item(0, es_col).text() == "typed"
+
+        self.window.toggle_unicode_display()
+
+        assert self.window.table.item(0, fr_col).text() == "Café"
+
+
 class TestTranslateAllMissingWiring(_OutstandingItemsWindowTestBase):
     """translate_all_missing/_on_translation_finished/_cancel_translation_worker delegate the
     QThread/TranslationWorker lifecycle to BackgroundTranslationController (see
@@ -0,0 +1,48 @@
+"""Tests for SettingsManager's per-project settings (project_settings in settings.json)."""
+
+import json
+
+from test_utils import isolated_settings_and_cache_env
+from utils.settings_manager import SettingsManager
+
+
+class TestSaveProjectSettings:
+    def setup_method(self):
+        self._env_ctx = isolated_settings_and_cache_env(prefix=".tmp_project_settings_")
+        self._env_ctx.__enter__()
+        self.settings_manager = SettingsManager()
+        self.project_path = "C:/tmp/project-settings-test-project"
+
+    def teardown_method(self):
+        self._env_ctx.__exit__(None, None, None)
+
+    def test_saves_every_value_readable_through_the_typed_getters(self):
+        assert self.settings_manager.save_project_settings(self.project_path, {
+            "default_locale": "de",
+            "locales": ["de", "fr"],
+            "project_type": "ruby",
+        })
+
+        assert self.settings_manager.get_project_default_locale(self.project_path) == "de"
+        assert self.settings_manager.get_project_locales(self.project_path) == ["de", "fr"]
+        assert self.settings_manager.get_project_type(self.project_path) == "ruby"
+
+    def test_keeps_existing_keys_not_in_the_update(self):
+        self.settings_manager.save_project_setting(self.project_path, "project_type", "python")
+
+        self.settings_manager.save_project_settings(self.project_path, {"locales": ["es"]})
+
+        assert self.settings_manager.get_project_type(self.project_path) == "python"
+        assert self.settings_manager.get_project_locales(self.project_path) == ["es"]
+
+    def test_intro_details_are_stored_in_the_same_write(self):
+        self.settings_manager.save_intro_details({"application_name": "Old"})
+
+        self.settings_manager.save_project_settings(
+            self.project_path, {"locales": ["es"]}, intro_details={"application_name": "New"}
+        )
+
+        with open(self.settings_manager.settings_file) as f:
+            settings = json.load(f)
+        assert settings["intro_details"] == {"application_name": "New"}
+        assert self.settings_manager.get_project_locales(self.project_path) == ["es"]
@@ -0,0 +1,265 @@
+"""Tests for ui.setup_translation_project_window.SetupTranslationProjectWindow.
+
+Covers the locale directory scan (deferred until project-type detection reports back), the
+controls that stay disabled until it finishes, and the files save_configuration creates.
+"""
+
+import json
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt6.QtWidgets import QApplication, QMessageBox
+    _HAS_PYQT6 = True
+except Exception:
+    QApplication = None
+    QMessageBox = None
+    _HAS_PYQT6 = False
+
+from unittest.mock import patch
+
+from test_utils import isolated_settings_and_cache_env
+from utils.globals import ProjectType
+
+
+def _touch(path, text=""):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def _list_texts(window):
+    return [window.locales_list.item(i).text() for i in range(window.locales_list.count())]
+
+
+@pytest.mark.skipif(not _HAS_PYQT6, reason="PyQt6 not installed in this environment")
+class TestContainsFileWithSuffix:
+    def test_finds_a_nested_match(self, tmp_path):
+        from ui.setup_translation_project_window import _contains_file_with_suffix
+
+        _touch(str(tmp_path / "a" / "b" / "fr.yml"))
+
+        assert _contains_file_with_suffix(str(tmp_path), (".yml",))
+
+    def test_ignores_hidden_entries_and_other_suffixes(self, tmp_path):
+        from ui.setup_translation_project_window import _contains_file_with_suffix
+
+        _touch(str(tmp_path / ".cache" / "fr.yml"))
+        _touch(str(tmp_path / ".fr.yml"))
+        _touch(str(tmp_path / "notes.txt"))
+
+        assert not _contains_file_with_suffix(str(tmp_path), (".yml",))
+
+    def test_missing_root_is_no_match(self, tmp_path):
+        from ui.setup_translation_project_window import _contains_file_with_suffix
+
+        assert not _contains_file_with_suffix(str(tmp_path / "missing"), (".json",))
+
+
+@pytest.mark.skipif(not _HAS_PYQT6, reason="PyQt6 not installed in this environment")
+class TestCreatePythonLocalePo:
+    def test_creates_directories_and_base_po_with_header(self, tmp_path):
+        from ui.setup_translation_project_window import _create_python_locale_po
+
+        _create_python_locale_po(str(tmp_path), "fr", "header\n")
+
+        po_file = tmp_path / "fr" / "LC_MESSAGES" / "base.po"
+        assert po_file.read_text(encoding="utf-8") == "header\n"
+
+    def test_leaves_an_existing_base_po_untouched(self, tmp_path):
+        from ui.setup_translation_project_window import _create_python_locale_po
+
+        po_file = tmp_path / "fr" / "LC_MESSAGES" / "base.po"
+        _touch(str(po_file), "existing\n")
+
+        _create_python_locale_po(str(tmp_path), "fr", "header\n")
+
+        assert po_file.read_text(encoding="utf-8") == "existing\n"
+
+
+@pytest.mark.skipif(not _HAS_PYQT6, reason="PyQt6 not installed in this environment")
+class _SetupWindowTestBase:
+    @classmethod
+    def setup_class(cls):
+        cls._app = QApplication.instance() or QApplication([])
+
+    def setup_method(self):
+        self._env_ctx = isolated_settings_and_cache_env(prefix=".tmp_setup_project_window_")
+        self._env_ctx.__enter__()
+        self.windows = []
+
+    def teardown_method(self):
+        for window in self.windows:
+            window.done(0)
+            window.deleteLater()
+        self._env_ctx.__exit__(None, None, None)
+
+    def _open(self, project_dir, project_type=None, start_detection=False):
+        """Open the window with its deferred work held back until _finish_loading.
+
+        The locale scan scheduled with QTimer.singleShot is captured rather than left to the
+        event loop, and unless ``start_detection`` is set the detection thread is not started
+        (_finish_loading runs it inline instead).
+        """
+        from ui.setup_translation_project_window import (
+            ProjectTypeDetectionWorker,
+            SetupTranslationProjectWindow,
+        )
+        from utils.settings_manager import SettingsManager
+
+        if project_type is not None:
+            SettingsManager().save_project_setting(str(project_dir), "project_type", project_type.value)
+        with patch("ui.setup_translation_project_window.QTimer.singleShot") as single_shot:
+            if start_detection:
+                window = SetupTranslationProjectWindow(str(project_dir))
+            else:
+                with patch.object(ProjectTypeDetectionWorker, "start"):
+                    window = SetupTranslationProjectWindow(str(project_dir))
+        window._test_deferred = [args[1] for args, _kwargs in single_shot.call_args_list]
+        self.windows.append(window)
+        return window
+
+    def _finish_loading(self, window):
+        """Run the detection (its signal then reaches the window directly) or the deferred scan."""
+        if window._detection_worker is not None:
+            window._detection_worker.run()
+        deferred, window._test_deferred = window._test_deferred, []
+        for callback in deferred:
+            callback()
+
+
+class TestLocaleLoading(_SetupWindowTestBase):
+    def test_locale_controls_stay_disabled_until_the_scan_finishes(self, tmp_path):
+        os.makedirs(tmp_path / "locale" / "fr")
+        os.makedirs(tmp_path / "locale" / "de")
+
+        window = self._open(tmp_path)
+
+        assert window._detection_worker is not None
+        assert not window.add_locale_btn.isEnabled()
+        assert not window.remove_locale_btn.isEnabled()
+        assert not window.save_btn.isEnabled()
+
+        self._finish_loading(window)
+
+        assert window.add_locale_btn.isEnabled()
+        assert window.remove_locale_btn.isEnabled()
+        assert window.save_btn.isEnabled()
+        assert sorted(_list_texts(window)) == ["de", "fr"]
+
+    def test_picker_additions_after_the_scan_keep_list_and_set_in_step(self, tmp_path):
+        os.makedirs(tmp_path / "locale" / "fr")
+        os.makedirs(tmp_path / "locale" / "de")
+        window = self._open(tmp_path)
+        self._finish_loading(window)
+
+        with patch.object(QMessageBox, "warning") as warning:
+            window._append_locale_from_picker("fr")
+            window._append_locale_from_picker("es")
+
+        warning.assert_called_once()
+        assert sorted(_list_texts(window)) == ["de", "es", "fr"]
+        assert window._locale_set == {"de", "es", "fr"}
+
+    def test_saved_project_type_scans_on_the_next_event_loop_turn(self, tmp_path):
+        os.makedirs(tmp_path / "locale" / "fr")
+
+        window = self._open(tmp_path, ProjectType.PYTHON)
+
+        assert window._detection_worker is None
+        assert _list_texts(window) == []
+        assert not window.save_btn.isEnabled()
+
+        self._finish_loading(window)
+
+        assert _list_texts(window) == ["fr"]
+        assert window.save_btn.isEnabled()
+
+    def test_detected_type_selects_the_combo_and_drives_the_scan(self, tmp_path):
+        _touch(str(tmp_path / "Gemfile"))
+        _touch(str(tmp_path / "config" / "locales" / "fr" / "fr.yml"), "fr: {}\n")
+        os.makedirs(tmp_path / "config" / "locales" / "de")  # no YAML files, not a locale
+
+        window = self._open(tmp_path)
+        self._finish_loading(window)
+
+        assert window.project_type == ProjectType.RUBY.value
+        assert window.project_type_combo.currentData() == ProjectType.RUBY.value
+        assert _list_texts(window) == ["fr"]
+
+    def test_detection_keeps_a_project_type_the_user_picked_meanwhile(self, tmp_path):
+        _touch(str(tmp_path / "Gemfile"))
+
+        window = self._open(tmp_path)
+        java_index = window.project_type_combo.findData(ProjectType.JAVA.value)
+        window.project_type_combo.setCurrentIndex(java_index)
+        self._finish_loading(window)
+
+        assert window.project_type_combo.currentData() == ProjectType.JAVA.value
+
+    def test_closing_waits_for_a_running_detection(self, tmp_path):
+        window = self._open(tmp_path, start_detection=True)
+
+        window.reject()
+
+        assert not window._detection_worker.isRunning()
+
+    def test_default_locale_directory_without_yaml_is_still_listed(self, tmp_path):
+        os.makedirs(tmp_path / "config" / "locales" / "en")
+        os.makedirs(tmp_path / "config" / "locales" / "de")
+
+        window = self._open(tmp_path, ProjectType.RUBY)
+        self._finish_loading(window)
+
+        assert _list_texts(window) == ["en"]
+
+
+class TestSaveConfiguration(_SetupWindowTestBase):
+    def test_ruby_save_creates_missing_application_yml_and_keeps_existing_ones(self, tmp_path):
+        existing = tmp_path / "config" / "locales" / "fr" / "application.yml"
+        _touch(str(existing), "fr:\n  custom: true\n")
+
+        window = self._open(tmp_path, ProjectType.RUBY)
+        self._finish_loading(window)
+        window.default_locale.setCurrentText("en")
+        window._append_locale_from_picker("en")
+        window.app_name.setText("Demo")
+
+        with patch.object(QMessageBox, "critical") as critical, \
+                patch.object(QMessageBox, "warning") as warning:
+            window.save_configuration()
+
+        critical.assert_not_called()
+        warning.assert_not_called()
+        assert existing.read_text(encoding="utf-8") == "fr:\n  custom: true\n"
+        created = tmp_path / "config" / "locales" / "en" / "application.yml"
+        assert created.read_text(encoding="utf-8") == "en:\n  application:\n    name: Demo\n"
+
+    def test_save_persists_project_settings(self, tmp_path):
+        from utils.settings_manager import SettingsManager
+
+        os.makedirs(tmp_path / "locale" / "en")
+        window = self._open(tmp_path, ProjectType.PYTHON)
+        self._finish_loading(window)
+        window.default_locale.setCurrentText("en")
+        window._append_locale_from_picker("de")
+        window.app_name.setText("Demo")
+
+        with patch.object(QMessageBox, "critical") as critical, \
+                patch.object(QMessageBox, "warning") as warning, \
+                patch.object(SettingsManager, "save_intro_details") as save_intro_details:
+            window.save_configuration()
+
+        critical.assert_not_called()
+        warning.assert_not_called()
+        # Intro details go out with the project settings rather than in a second write
+        save_intro_details.assert_not_called()
+        settings_manager = SettingsManager()
+        with open(settings_manager.settings_file) as f:
+            assert json.load(f)["intro_details"]["application_name"] == "Demo"
+        assert settings_manager.get_project_locales(str(tmp_path)) == ["en", "de"]
+        assert settings_manager.get_project_type(str(tmp_path)) == ProjectType.PYTHON.value
+        assert (tmp_path / "locale" / "de" / "LC_MESSAGES" / "base.po").exists()
@@ -0,0 +1,133 @@
+"""Tests for ui.stats_widget.StatsWidget."""
+
+import os
+from datetime import datetime
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    from PyQt6.QtWidgets import QApplication
+    _HAS_PYQT6 = True
+except Exception:
+    QApplication = None
+    _HAS_PYQT6 = False
+
+from i18n.invalid_translation_groups import InvalidTranslationGroups
+from i18n.translation_manager_results import TranslationAction, TranslationManagerResults
+
+
+def _make_results(missing_locale_groups=(), not_in_base=(), total_strings=3, total_locales=2):
+    invalid_groups = InvalidTranslationGroups(
+        not_in_base=list(not_in_base),
+        missing_locale_groups=list(missing_locale_groups),
+    )
+    return TranslationManagerResults(
+        project_dir="C:/tmp/stats-widget-test-project",
+        action=TranslationAction.CHECK_STATUS,
+        action_timestamp=datetime.now(),
+        action_successful=True,
+        locale_statuses={},
+        failed_locales=[],
+        default_locale="en",
+        has_locale_dir=True,
+        has_pot_file=True,
+        pot_file_path=None,
+        pot_last_modified=None,
+        total_strings=total_strings,
+        total_locales=total_locales,
+        invalid_groups=invalid_groups,
+    )
+
+
+@pytest.mark.skipif(not _HAS_PYQT6, reason="PyQt6 not installed in this environment")
+class TestStatsWidget:
+    @classmethod
+    def setup_class(cls):
+        cls._app = QApplication.instance() or QApplication([])
+
+    def setup_method(self):
+        from ui.stats_widget import StatsWidget
+
+        self.widget = StatsWidget()
+
+    def teardown_method(self):
+        self.widget.deleteLater()
+
+    def test_shows_counts_and_switches_to_success_style_when_nothing_is_missing(self):
+        self.widget.update_stats(
+            _make_results(missing_locale_groups=[("greeting", ["de", "fr"])], not_in_base=["old"])
+        )
+
+        assert self.widget.total_translations_value.text() == "3"
+        assert self.widget.missing_translations_value.text() == "2"
+        assert self.widget.stale_translations_value.text() == "1"
+        assert self.widget.styleSheet() == self.widget._default_qss
+
+        self.widget.update_stats(_make_results())
+
+        assert self.widget.missing_translations_value.text() == "0"
+        assert self.widget.styleSheet() == self.widget._success_qss
+
+    def test_widget_stylesheet_is_only_reapplied_when_the_style_changes(self):
+        calls = []
+        original = self.widget.setStyleSheet
+        self.widget.setStyleSheet = lambda qss: (calls.append(qss), original(qss))
+
+        self.widget.update_stats(_make_results())
+        self.widget.update_stats(_make_results())
+        self.widget.set_loading_state()
+        self.widget.set_loading_state()
+
+        assert calls == [self.widget._success_qss, self.widget._default_qss]
+
+    def test_identical_refresh_leaves_labels_alone_until_placeholders_are_shown(self):
+        results = _make_results(missing_locale_groups=[("greeting", ["de"])])
+        self.widget.update_stats(results)
+        self.widget.missing_translations_value.setText("sentinel")
+
+        self.widget.update_stats(results)
+
+        assert self.widget.missing_translations_value.text() == "sentinel"
+
+        self.widget.set_loading_state()
+        self.widget.update_stats(results)
+
+        assert self.widget.missing_translations_value.text() == "1"
+
+    def test_requested_updates_are_coalesced_and_cancelled_by_loading_state(self):
+        self.widget.request_update_stats(_make_results(total_strings=1))
+        self.widget.request_update_stats(_make_results(total_strings=2))
+
+        assert self.widget.total_translations_value.text() == "-"
+
+        self.widget._update_timer.timeout.emit()
+
+        assert self.widget.total_translations_value.text() == "2"
+
+        self.widget.request_update_stats(_make_results(total_strings=5))
+        self.widget.set_loading_state()
+        self.widget._update_timer.timeout.emit()
+
+        assert self.widget.total_translations_value.text() == "-"
+
+    def test_refresh_only_sets_text_on_labels_whose_value_changed(self):
+        self.widget.update_stats(_make_results(missing_locale_groups=[("greeting", ["de"])]))
+        self.widget.total_translations_value.setText("sentinel")
+
+        self.widget.update_stats(_make_results(missing_locale_groups=[("greeting", ["de", "fr"])]))
+
+        assert self.widget.total_translations_value.text() == "sentinel"
+        assert self.widget.missing_translations_value.text() == "2"
+
+    def test_requests_while_hidden_wait_until_the_widget_is_shown(self):
+        self.widget.request_update_stats(_make_results(total_strings=4))
+
+        assert not self.widget._update_timer.isActive()
+
+        self.widget.show()
+
+        assert self.widget._update_timer.isActive()
+        self.widget._update_timer.timeout.emit()
+        assert self.widget.total_translations_value.text() == "4"
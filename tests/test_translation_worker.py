@@ -0,0 +1,68 @@
+"""Tests for workers.translation_worker.TranslationWorker."""
+
+import os
+from datetime import datetime
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+try:
+    import PyQt6  # noqa: F401
+    _HAS_PYQT6 = True
+except Exception:
+    _HAS_PYQT6 = False
+
+from i18n.invalid_translation_groups import InvalidTranslationGroups
+from i18n.translation_group import TranslationKey
+from i18n.translation_manager_results import TranslationAction, TranslationManagerResults
+
+
+class _FakeManager:
+    """Stands in for I18NManager: returns canned results from manage_translations."""
+
+    def __init__(self, results):
+        self.results = results
+        self.translations = {}
+        self.locales = ["en", "fr"]
+
+    def manage_translations(self, action, modified_locales):
+        return self.results
+
+
+def _make_results(invalid_groups):
+    return TranslationManagerResults(
+        project_dir="/tmp/translation-worker-test-project",
+        action=TranslationAction.CHECK_STATUS,
+        action_timestamp=datetime.now(),
+        action_successful=True,
+        locale_statuses={},
+        failed_locales=[],
+        default_locale="en",
+        has_locale_dir=True,
+        has_pot_file=True,
+        pot_file_path=None,
+        pot_last_modified=None,
+        invalid_groups=invalid_groups,
+    )
+
+
+@pytest.mark.skipif(not _HAS_PYQT6, reason="PyQt6 not installed in this environment")
+class TestTranslationWorkerRun:
+    def test_stats_counts_are_cached_before_results_are_emitted(self):
+        from workers.translation_worker import TranslationWorker
+
+        invalid_groups = InvalidTranslationGroups()
+        invalid_groups.missing_locale_groups.append((TranslationKey("greeting"), ["fr"]))
+        worker = TranslationWorker("/tmp/translation-worker-test-project",
+                                   manager=_FakeManager(_make_results(invalid_groups)))
+        emitted = []
+        worker.stats_updated.connect(emitted.append)
+
+        worker.run()
+
+        assert [r.invalid_groups for r in emitted] == [invalid_groups]
+        # cached_property stores each computed count in the instance dict
+        assert vars(invalid_groups)["missing_count"] == 1
+        assert vars(invalid_groups)["stale_count"] == 0
+        assert "invalid_character_set_count" in vars(invalid_groups)
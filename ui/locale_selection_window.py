@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import re
+
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtWidgets import (
     QComboBox,
@@ -36,6 +38,10 @@ _ = I18N._
 
 MAX_SUGGESTION_BUTTONS = 18
 
+# Well-formed ``xx``, ``xx_YY`` or ``xx_YY_Ssss`` tag (ASCII letters, lowercase language so it
+# can be looked up as-is), see validate_locale_code
+_LOCALE_CODE_PATTERN = re.compile(r"([a-z]{2})(?:_([A-Z]{2})(?:_([A-Z][A-Za-z]{3}))?)?")
+
 
 def validate_locale_code(locale_code: str) -> str | None:
     """Validate a locale tag against stored ISO sets.
@@ -48,6 +54,19 @@ def validate_locale_code(locale_code: str) -> str | None:
     Returns:
         None if valid, otherwise a translated error message string.
     """
+    # Fast path: well-formed tags only need the ISO set lookups. Anything else goes through the
+    # part-by-part checks below, which pick the specific error message.
+    match = _LOCALE_CODE_PATTERN.fullmatch(locale_code)
+    if match is not None:
+        language, country, script = match.groups()
+        if language not in valid_language_codes:
+            return _("Invalid language code. Must be a valid ISO 639-1 code")
+        if country is not None and country not in valid_country_codes:
+            return _("Invalid country code. Must be a valid ISO 3166-1 code")
+        if script is not None and script not in valid_script_codes:
+            return _("Invalid script code. Must be a valid ISO 15924 code")
+        return None
+
     parts = locale_code.split("_")
 
     if not parts or not parts[0].isalpha() or len(parts[0]) != 2:
@@ -86,6 +86,7 @@ class RecentProjectsDialog(SmartDialog):
         )
         self.setMinimumSize(700, 300)
         self.settings_manager = SettingsManager()
+        self._path_to_item = {}  # project path -> its QListWidgetItem
         self.setup_ui(recent_projects)
         
     def setup_ui(self, recent_projects):
@@ -133,22 +134,20 @@ class RecentProjectsDialog(SmartDialog):
         """Add a project item to the list."""
         project_type = self.settings_manager.get_project_type(project_path)
         item = QListWidgetItem()
-        item.setSizeHint(ProjectListItem(project_path, project_type).sizeHint())
         widget = ProjectListItem(project_path, project_type)
+        item.setSizeHint(widget.sizeHint())
         widget.remove_clicked.connect(self.remove_project)
         widget.select_clicked.connect(self.handle_selection)
         self.list_widget.addItem(item)
         self.list_widget.setItemWidget(item, widget)
+        self._path_to_item[project_path] = item
         
     def remove_project(self, project_path):
         """Remove a project from the list."""
-        for i in range(self.list_widget.count()):
-            item = self.list_widget.item(i)
-            widget = self.list_widget.itemWidget(item)
-            if widget.project_path == project_path:
-                self.list_widget.takeItem(i)
-                self.project_removed.emit(project_path)
-                break
+        item = self._path_to_item.pop(project_path, None)
+        if item is not None:
+            self.list_widget.takeItem(self.list_widget.row(item))
+            self.project_removed.emit(project_path)
         
     def handle_selection(self):
         selected_items = self.list_widget.selectedItems()
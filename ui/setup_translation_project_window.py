@@ -1,7 +1,8 @@
 from PyQt6.QtWidgets import (QVBoxLayout, QHBoxLayout, QPushButton, 
                             QLabel, QLineEdit, QFormLayout, QListWidget, QListWidgetItem,
                             QMessageBox, QFrame, QComboBox)
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import QThread, QTimer, pyqtSignal
+from concurrent.futures import ThreadPoolExecutor
 import os
 
 from lib.multi_display import SmartDialog
@@ -17,6 +18,81 @@ _ = I18N._
 
 logger = get_logger("setup_translation_project_window")
 
+# Locales offered in the Default Locale combo
+_DEFAULT_LOCALE_CHOICES = ("en", "fr", "de", "es", "it", "ja", "ko", "zh")
+
+# Standard gettext header for new Python base.po files, see get_po_header
+_PO_HEADER_TEMPLATE = '''msgid ""
+msgstr ""
+"Project-Id-Version: {app_name} {version}\\n"
+"Language: {locale}\\n"
+"MIME-Version: 1.0\\n"
+"Content-Type: text/plain; charset=UTF-8\\n"
+"Content-Transfer-Encoding: 8bit\\n"
+"First-Author: {author}\\n"
+"Last-Translator: {translator}\\n"
+'''
+
+def _contains_file_with_suffix(root, suffixes):
+    """Return True if any non-hidden file below ``root`` ends with one of ``suffixes``.
+    
+    Walks the tree like a recursive glob would (skipping dot-entries, following directory
+    symlinks) but stops at the first match instead of collecting every file.
+    """
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as scan:
+                for entry in scan:
+                    if entry.name.startswith('.'):
+                        continue
+                    if entry.is_dir():
+                        pending.append(entry.path)
+                    elif entry.name.endswith(suffixes):
+                        return True
+        except OSError:
+            continue
+    return False
+
+
+def _create_python_locale_po(locale_dir, locale_code, header):
+    """Create ``locale/<locale>/LC_MESSAGES/base.po`` with ``header`` unless it already exists."""
+    # locale_dir already exists, so two targeted mkdir calls replace makedirs' ancestor walk
+    locale_root = os.path.join(locale_dir, locale_code)
+    locale_path = os.path.join(locale_root, 'LC_MESSAGES')
+    for path in (locale_root, locale_path):
+        try:
+            os.mkdir(path)
+        except FileExistsError:
+            pass
+    
+    # Create empty PO file if it doesn't exist ('x' mode checks and creates in one open call)
+    po_file = os.path.join(locale_path, 'base.po')
+    try:
+        with open(po_file, 'x', encoding='utf-8') as f:
+            f.write(header)
+    except FileExistsError:
+        pass
+
+
+class ProjectTypeDetectionWorker(QThread):
+    """Worker thread that runs ProjectDetector over the project tree."""
+    
+    detected = pyqtSignal(str)  # ProjectType value, or "" if the type could not be determined
+    
+    def __init__(self, project_dir):
+        super().__init__()
+        self.project_dir = project_dir
+        
+    def run(self):
+        try:
+            detected_type = ProjectDetector.detect_project_type(self.project_dir)
+        except Exception as e:
+            logger.error(f"Error detecting project type: {e}")
+            detected_type = None
+        self.detected.emit(detected_type.value if detected_type else "")
+
+
 class SetupTranslationProjectWindow(SmartDialog):
     project_configured = pyqtSignal()  # Emitted when project setup is complete
 
@@ -33,8 +109,20 @@ class SetupTranslationProjectWindow(SmartDialog):
         self.settings_manager = SettingsManager()
         self.intro_details = self.settings_manager.get_intro_details()
         self.setMinimumSize(600, 500)
+        # Locale codes currently in self.locales_list, for constant-time duplicate checks
+        self._locale_set = set()
         self.load_project_settings()
         self.setup_ui()
+        # The locale list is incomplete until load_existing_locales has run; editing or saving it
+        # before then would be overwritten by (or would drop) the scanned locales
+        self._set_locale_controls_enabled(False)
+        if self._detection_worker is not None:
+            # The locale scan depends on the project type, so it runs once detection reports back
+            self._detection_worker.detected.connect(self._on_project_type_detected)
+            self._detection_worker.start()
+        else:
+            # Scan the locale directory on the next event-loop turn so the dialog paints first
+            QTimer.singleShot(0, self.load_existing_locales)
         
     def load_project_settings(self):
         """Load project-specific settings if they exist."""
@@ -56,15 +144,33 @@ class SetupTranslationProjectWindow(SmartDialog):
             
         # Load or detect project type
         self.project_type = self.settings_manager.get_project_type(self.project_dir)
+        self._detection_worker = None
         if not self.project_type:
-            # Detect project type if not saved
-            detected_type = ProjectDetector.detect_project_type(self.project_dir)
-            if detected_type:
-                self.project_type = detected_type.value
-                logger.debug(f"Detected project type: {self.project_type}")
-            else:
-                self.project_type = ProjectType.PYTHON.value  # Default to Python
-                logger.debug("Could not detect project type, defaulting to Python")
+            # Detect project type if not saved. Detection walks the whole project tree, so it
+            # runs on a worker thread; Python stands in until it reports back.
+            self.project_type = ProjectType.PYTHON.value
+            self._detection_worker = ProjectTypeDetectionWorker(self.project_dir)
+            
+    def _on_project_type_detected(self, detected_value):
+        """Apply the background detection result, then scan for existing locales."""
+        # Leave the combo alone if the user already picked a type while detection ran
+        if self.project_type_combo.currentData() != self.project_type:
+            logger.debug("Project type changed by user during detection, keeping selection")
+        elif detected_value:
+            self.project_type = detected_value
+            index = self.project_type_combo.findData(detected_value)
+            if index >= 0:
+                self.project_type_combo.setCurrentIndex(index)
+            logger.debug(f"Detected project type: {self.project_type}")
+        else:
+            logger.debug("Could not detect project type, defaulting to Python")
+        self.load_existing_locales()
+        
+    def done(self, result):
+        # The detection thread must finish before the dialog (and the QThread with it) goes away
+        if self._detection_worker is not None and self._detection_worker.isRunning():
+            self._detection_worker.wait()
+        super().done(result)
         
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -105,7 +211,7 @@ class SetupTranslationProjectWindow(SmartDialog):
         
         # Default locale selection
         self.default_locale = QComboBox()
-        self.default_locale.addItems(["en", "fr", "de", "es", "it", "ja", "ko", "zh"])
+        self.default_locale.addItems(_DEFAULT_LOCALE_CHOICES)
         current_default = self.intro_details.get("translation.default_locale", "en")
         self.default_locale.setCurrentText(current_default)
         info_layout.addRow(_("Default Locale:"), self.default_locale)
@@ -125,9 +231,9 @@ class SetupTranslationProjectWindow(SmartDialog):
         # Locale management
         locale_controls = QHBoxLayout()
         
-        add_locale_btn = QPushButton(_("Add locale…"))
-        add_locale_btn.clicked.connect(self.open_locale_selection)
-        locale_controls.addWidget(add_locale_btn)
+        self.add_locale_btn = QPushButton(_("Add locale…"))
+        self.add_locale_btn.clicked.connect(self.open_locale_selection)
+        locale_controls.addWidget(self.add_locale_btn)
         locale_controls.addStretch()
         
         locales_layout.addLayout(locale_controls)
@@ -135,27 +241,26 @@ class SetupTranslationProjectWindow(SmartDialog):
         # List of locales
         self.locales_list = QListWidget()
         self.locales_list.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
-        self.load_existing_locales()
         locales_layout.addWidget(self.locales_list)
         
         # Remove locale button
-        remove_locale_btn = QPushButton(_("Remove Selected Locale"))
-        remove_locale_btn.clicked.connect(self.remove_locale)
-        locales_layout.addWidget(remove_locale_btn)
+        self.remove_locale_btn = QPushButton(_("Remove Selected Locale"))
+        self.remove_locale_btn.clicked.connect(self.remove_locale)
+        locales_layout.addWidget(self.remove_locale_btn)
         
         layout.addWidget(locales_frame)
         
         # Buttons
         button_layout = QHBoxLayout()
         
-        save_btn = QPushButton(_("Save Configuration"))
-        save_btn.clicked.connect(self.save_configuration)
+        self.save_btn = QPushButton(_("Save Configuration"))
+        self.save_btn.clicked.connect(self.save_configuration)
         exclusions_btn = QPushButton(_("Heuristic Exclusions"))
         exclusions_btn.clicked.connect(self.open_quality_exclusions)
         cancel_btn = QPushButton(_("Cancel"))
         cancel_btn.clicked.connect(self.reject)
         
-        button_layout.addWidget(save_btn)
+        button_layout.addWidget(self.save_btn)
         button_layout.addWidget(exclusions_btn)
         button_layout.addWidget(cancel_btn)
         layout.addLayout(button_layout)
@@ -168,9 +273,23 @@ class SetupTranslationProjectWindow(SmartDialog):
         )
         dialog.exec()
         
+    def _set_locale_controls_enabled(self, enabled: bool) -> None:
+        self.add_locale_btn.setEnabled(enabled)
+        self.remove_locale_btn.setEnabled(enabled)
+        self.save_btn.setEnabled(enabled)
+
     def load_existing_locales(self):
         """Load existing locales from the project directory."""
+        # Runs from the event loop after the dialog opens; the controls come back even if it fails
+        try:
+            self._scan_existing_locales()
+        finally:
+            self._set_locale_controls_enabled(True)
+
+    def _scan_existing_locales(self):
         temp_locales = set()
+        # Display order for locales_list, which is filled with a single addItems call at the end
+        ordered_locales = []
         
         # Determine locale directory based on project type
         if self.project_type == ProjectType.RUBY.value:
@@ -190,62 +309,74 @@ class SetupTranslationProjectWindow(SmartDialog):
             if not os.path.exists(locale_dir):
                 locale_dir = os.path.join(self.project_dir, 'locales')
         
-        if os.path.exists(locale_dir):
-            for item in os.listdir(locale_dir):
-                full_path = os.path.join(locale_dir, item)
-                # For Ruby, check if it's a directory with YAML files
-                # For Python, check if it's a directory (locale structure)
-                if os.path.isdir(full_path) and not item.startswith('__'):
-                    if self.project_type == ProjectType.RUBY.value:
-                        # For Ruby, verify it has YAML files
-                        import glob
-                        yaml_files = glob.glob(os.path.join(full_path, '**', '*.yml'), recursive=True)
-                        if yaml_files:
-                            self.locales_list.addItem(item)
-                            temp_locales.add(item)
-                    elif self.project_type == ProjectType.JAVASCRIPT.value:
-                        # JS nested structure: locales/en/translation.json
-                        import glob
-                        locale_files = []
-                        locale_files.extend(glob.glob(os.path.join(full_path, '**', '*.json'), recursive=True))
-                        locale_files.extend(glob.glob(os.path.join(full_path, '**', '*.js'), recursive=True))
-                        locale_files.extend(glob.glob(os.path.join(full_path, '**', '*.ts'), recursive=True))
-                        if locale_files:
-                            self.locales_list.addItem(item)
-                            temp_locales.add(item)
-                    else:
-                        # For Python, just check if it's a directory
-                        self.locales_list.addItem(item)
+        # scandir entries carry the file type, so no extra stat per entry for isdir/isfile;
+        # a missing locale directory is caught here instead of checked with a separate exists() stat
+        try:
+            with os.scandir(locale_dir) as scan:
+                dir_entries = list(scan)
+        except (FileNotFoundError, NotADirectoryError):
+            dir_entries = []
+        # Project type checks hoisted out of the per-entry loop
+        is_ruby = self.project_type == ProjectType.RUBY.value
+        is_java = self.project_type == ProjectType.JAVA.value
+        is_javascript = self.project_type == ProjectType.JAVASCRIPT.value
+        for entry in dir_entries:
+            item = entry.name
+            full_path = entry.path
+            # For Ruby, check if it's a directory with YAML files
+            # For Python, check if it's a directory (locale structure)
+            if entry.is_dir() and not item.startswith('__'):
+                if is_ruby:
+                    # For Ruby, verify it has YAML files
+                    if _contains_file_with_suffix(full_path, ('.yml',)):
+                        ordered_locales.append(item)
                         temp_locales.add(item)
-                elif self.project_type == ProjectType.JAVA.value and os.path.isfile(full_path):
-                    # Java ResourceBundle files: messages.properties or messages_<locale>.properties
-                    if item == "messages.properties":
-                        default_locale = self.intro_details.get("translation.default_locale", "en")
-                        self.locales_list.addItem(default_locale)
-                        temp_locales.add(default_locale)
-                    elif item.startswith("messages_") and item.endswith(".properties"):
-                        locale_code = item[len("messages_"):-len(".properties")]
-                        if locale_code and locale_code not in temp_locales:
-                            self.locales_list.addItem(locale_code)
-                            temp_locales.add(locale_code)
-                elif self.project_type == ProjectType.JAVASCRIPT.value and os.path.isfile(full_path):
-                    # JS flat structure: src/locales/en.json or src/locales/en.js
-                    base_name, ext = os.path.splitext(item)
-                    if ext.lower() in ['.json', '.js', '.ts'] and validate_locale_code(base_name) is None:
-                        if base_name not in temp_locales:
-                            self.locales_list.addItem(base_name)
-                            temp_locales.add(base_name)
-        
+                elif is_javascript:
+                    # JS nested structure: locales/en/translation.json
+                    if _contains_file_with_suffix(full_path, ('.json', '.js', '.ts')):
+                        ordered_locales.append(item)
+                        temp_locales.add(item)
+                else:
+                    # For Python, just check if it's a directory
+                    ordered_locales.append(item)
+                    temp_locales.add(item)
+            elif is_java and entry.is_file():
+                # Java ResourceBundle files: messages.properties or messages_<locale>.properties
+                if item == "messages.properties":
+                    default_locale = self.intro_details.get("translation.default_locale", "en")
+                    ordered_locales.append(default_locale)
+                    temp_locales.add(default_locale)
+                elif item.startswith("messages_") and item.endswith(".properties"):
+                    locale_code = item[len("messages_"):-len(".properties")]
+                    if locale_code and locale_code not in temp_locales:
+                        ordered_locales.append(locale_code)
+                        temp_locales.add(locale_code)
+            elif is_javascript and entry.is_file():
+                # JS flat structure: src/locales/en.json or src/locales/en.js
+                base_name, ext = os.path.splitext(item)
+                if ext.lower() in ['.json', '.js', '.ts'] and validate_locale_code(base_name) is None:
+                    if base_name not in temp_locales:
+                        ordered_locales.append(base_name)
+                        temp_locales.add(base_name)
+    
         # Also load from saved project locales if they exist
         if self.project_locales:
             for locale in self.project_locales:
                 if locale not in temp_locales:
-                    self.locales_list.addItem(locale)
+                    ordered_locales.append(locale)
                     temp_locales.add(locale)
         
         # Ensure default locale is in the list if it exists in the filesystem
         default_locale = self.intro_details.get("translation.default_locale", "en")
         if default_locale and default_locale not in temp_locales:
+            scanned_names = {entry.name for entry in dir_entries}
+            
+            def path_exists(path):
+                # Paths directly inside locale_dir were already listed by the scan above
+                if os.path.dirname(path) == locale_dir:
+                    return os.path.basename(path) in scanned_names
+                return os.path.exists(path)
+            
             # Check if default locale exists in filesystem
             if self.project_type == ProjectType.RUBY.value:
                 default_locale_path = os.path.join(self.project_dir, 'config', 'locales', default_locale)
@@ -256,13 +387,13 @@ class SetupTranslationProjectWindow(SmartDialog):
                     default_locale_path = os.path.join(self.project_dir, 'src', 'main', 'resources', f'messages_{default_locale}.properties')
             elif self.project_type == ProjectType.JAVASCRIPT.value:
                 default_locale_path = os.path.join(self.project_dir, 'src', 'locales', f'{default_locale}.json')
-                if not os.path.exists(default_locale_path):
+                if not path_exists(default_locale_path):
                     default_locale_path = os.path.join(self.project_dir, 'src', 'locales', default_locale, 'translation.json')
             else:
                 default_locale_path = os.path.join(self.project_dir, 'locale', default_locale)
             
-            if os.path.exists(default_locale_path):
-                self.locales_list.addItem(default_locale)
+            if path_exists(default_locale_path):
+                ordered_locales.append(default_locale)
                 temp_locales.add(default_locale)
                 logger.debug(f"Added default locale {default_locale} from filesystem")
         
@@ -274,10 +405,12 @@ class SetupTranslationProjectWindow(SmartDialog):
                 logger.debug(f"Adding new locale: {locale}")
             for locale in sorted(removed_locales):
                 logger.debug(f"Removing locale: {locale}")
-        self.project_locales = sorted(list(temp_locales))
+        self.project_locales = sorted(temp_locales)
+        self._locale_set = temp_locales
+        self.locales_list.addItems(ordered_locales)
 
     def _current_locale_set(self) -> set[str]:
-        return {self.locales_list.item(i).text().strip() for i in range(self.locales_list.count())}
+        return set(self._locale_set)
 
     def open_locale_selection(self) -> None:
         """Open the locale picker dialog."""
@@ -290,10 +423,11 @@ class SetupTranslationProjectWindow(SmartDialog):
         dlg.exec()
 
     def _append_locale_from_picker(self, locale_code: str) -> None:
-        if self.locales_list.findItems(locale_code, Qt.MatchFlag.MatchExactly):
+        if locale_code in self._locale_set:
             QMessageBox.warning(self, _("Error"), _("This locale already exists."))
             return
         self.locales_list.addItem(locale_code)
+        self._locale_set.add(locale_code)
 
     def remove_locale(self):
         """Remove the selected locale."""
@@ -313,6 +447,7 @@ class SetupTranslationProjectWindow(SmartDialog):
                                    
         if reply == QMessageBox.StandardButton.Yes:
             self.locales_list.takeItem(self.locales_list.row(current_item))
+            self._locale_set.discard(locale_code)
             
     def save_configuration(self):
         """Save the project configuration and create necessary directories."""
@@ -330,6 +465,8 @@ class SetupTranslationProjectWindow(SmartDialog):
                 )
                 if reply == QMessageBox.StandardButton.Yes:
                     self.locales_list.addItem(default_locale)
+                    self._locale_set.add(default_locale)
+                    locales.append(default_locale)
                 else:
                     return  # Don't save if user doesn't want to add default locale
             
@@ -341,10 +478,11 @@ class SetupTranslationProjectWindow(SmartDialog):
                     invalid_locales.append((locale, validation_result))
             
             if invalid_locales:
-                error_message = _("The following locale codes are invalid:") + "\n\n"
-                for locale, reason in invalid_locales:
-                    error_message += f"• {locale}: {reason}\n"
-                error_message += "\n\n" + _("Locale codes must follow ISO 639-1 (language) and optionally ISO 3166-1 (country) standards.")
+                error_message = (
+                    _("The following locale codes are invalid:") + "\n\n"
+                    + "".join(f"• {locale}: {reason}\n" for locale, reason in invalid_locales)
+                    + "\n\n" + _("Locale codes must follow ISO 639-1 (language) and optionally ISO 3166-1 (country) standards.")
+                )
                 
                 QMessageBox.warning(
                     self,
@@ -354,26 +492,26 @@ class SetupTranslationProjectWindow(SmartDialog):
                 )
                 return  # Don't save if there are invalid locales
             
-            # Get the list of locales
-            locales = [self.locales_list.item(i).text().strip() for i in range(self.locales_list.count())]
-            
-            # Save project-specific settings
-            self.settings_manager.save_project_default_locale(self.project_dir, self.default_locale.currentText())
-            self.settings_manager.save_project_locales(self.project_dir, locales)
-            self.project_type = self.project_type_combo.currentData()
-            self.settings_manager.save_project_type(self.project_dir, self.project_type)
-            
             # Also save to global intro details for backward compatibility
+            app_name = self.app_name.text()
             self.intro_details.update({
-                "application_name": self.app_name.text(),
+                "application_name": app_name,
                 "version": self.version.text(),
                 "first_author": self.author.text(),
                 "last_translator": self.translator.text(),
-                "translation.default_locale": self.default_locale.currentText()
+                "translation.default_locale": default_locale
             })
             
-            # Save to global settings for backward compatibility
-            self.settings_manager.save_intro_details(self.intro_details)
+            # Save project-specific settings and the intro details with one settings file write
+            self.project_type = self.project_type_combo.currentData()
+            self.settings_manager.save_project_settings(self.project_dir, {
+                "default_locale": default_locale,
+                "locales": locales,
+                "project_type": self.project_type,
+            }, intro_details=self.intro_details)
+            
+            # Placeholder application name written into new non-Python locale files
+            file_app_name = app_name or "Application Name"
             
             # Create locale directories and files based on project type
             if self.project_type == ProjectType.RUBY.value:
@@ -381,33 +519,36 @@ class SetupTranslationProjectWindow(SmartDialog):
                 locale_dir = os.path.join(self.project_dir, 'config', 'locales')
                 os.makedirs(locale_dir, exist_ok=True)
                 
-                for i in range(self.locales_list.count()):
-                    locale_code = self.locales_list.item(i).text().strip()
+                import yaml
+                # libyaml's C dumper when PyYAML was built with it; same output for these plain dicts
+                yaml_dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+                for locale_code in locales:
                     locale_path = os.path.join(locale_dir, locale_code)
                     os.makedirs(locale_path, exist_ok=True)
                     
                     # Create a basic application.yml file if it doesn't exist
-                    import yaml
                     application_yml = os.path.join(locale_path, 'application.yml')
-                    if not os.path.exists(application_yml):
-                        yaml_data = {
-                            locale_code: {
-                                "application": {
-                                    "name": self.app_name.text() or "Application Name"
-                                }
+                    yaml_data = {
+                        locale_code: {
+                            "application": {
+                                "name": file_app_name
                             }
                         }
-                        with open(application_yml, 'w', encoding='utf-8') as f:
-                            yaml.dump(yaml_data, f, default_flow_style=False, allow_unicode=True)
+                    }
+                    try:
+                        with open(application_yml, 'x', encoding='utf-8') as f:
+                            yaml.dump(yaml_data, f, Dumper=yaml_dumper, default_flow_style=False, allow_unicode=True)
+                    except FileExistsError:
+                        pass
+                    else:
                         logger.info(f"Created application.yml for locale {locale_code}")
             elif self.project_type == ProjectType.JAVA.value:
                 # Java projects: create ResourceBundle properties files in src/main/resources
                 resources_dir = os.path.join(self.project_dir, 'src', 'main', 'resources')
                 os.makedirs(resources_dir, exist_ok=True)
 
-                for i in range(self.locales_list.count()):
-                    locale_code = self.locales_list.item(i).text().strip()
-                    if locale_code == self.default_locale.currentText():
+                for locale_code in locales:
+                    if locale_code == default_locale:
                         file_name = 'messages.properties'
                     else:
                         file_name = f'messages_{locale_code}.properties'
@@ -415,7 +556,7 @@ class SetupTranslationProjectWindow(SmartDialog):
                     if not os.path.exists(file_path):
                         with open(file_path, 'w', encoding='utf-8') as f:
                             f.write(f"# {locale_code} translations\n")
-                            f.write(f"application.name={self.app_name.text() or 'Application Name'}\n")
+                            f.write(f"application.name={file_app_name}\n")
                         logger.info(f"Created {file_name} for locale {locale_code}")
             elif self.project_type == ProjectType.JAVASCRIPT.value:
                 # JavaScript projects: create JSON locale files in src/locales
@@ -423,13 +564,12 @@ class SetupTranslationProjectWindow(SmartDialog):
                 os.makedirs(locale_dir, exist_ok=True)
 
                 import json
-                for i in range(self.locales_list.count()):
-                    locale_code = self.locales_list.item(i).text().strip()
+                for locale_code in locales:
                     locale_file = os.path.join(locale_dir, f'{locale_code}.json')
                     if not os.path.exists(locale_file):
                         payload = {
                             "application": {
-                                "name": self.app_name.text() or "Application Name"
+                                "name": file_app_name
                             }
                         }
                         with open(locale_file, 'w', encoding='utf-8') as f:
@@ -440,17 +580,20 @@ class SetupTranslationProjectWindow(SmartDialog):
                 # Python projects: create locale/{locale}/LC_MESSAGES/ structure
                 locale_dir = os.path.join(self.project_dir, 'locale')
                 os.makedirs(locale_dir, exist_ok=True)
+                header_fields = self._po_header_fields()
+                headers = {
+                    locale_code: self.get_po_header(locale_code, header_fields)
+                    for locale_code in locales
+                }
                 
-                for i in range(self.locales_list.count()):
-                    locale_code = self.locales_list.item(i).text().strip()
-                    locale_path = os.path.join(locale_dir, locale_code, 'LC_MESSAGES')
-                    os.makedirs(locale_path, exist_ok=True)
-                    
-                    # Create empty PO file if it doesn't exist
-                    po_file = os.path.join(locale_path, 'base.po')
-                    if not os.path.exists(po_file):
-                        with open(po_file, 'w', encoding='utf-8') as f:
-                            f.write(self.get_po_header(locale_code))
+                # Each locale's directory and PO file are independent, so the filesystem work
+                # runs on a small thread pool; list() re-raises the first failure here.
+                if headers:
+                    with ThreadPoolExecutor(max_workers=min(8, len(headers))) as executor:
+                        list(executor.map(
+                            lambda item: _create_python_locale_po(locale_dir, *item),
+                            headers.items(),
+                        ))
             
             self.project_configured.emit()
             self.accept()
@@ -459,7 +602,16 @@ class SetupTranslationProjectWindow(SmartDialog):
             QMessageBox.critical(self, _("Error"), 
                                _("Failed to save configuration: {}").format(str(e)))
             
-    def get_po_header(self, locale):
+    def _po_header_fields(self):
+        """Read the form fields used by the PO header (once per save, not once per locale)."""
+        return {
+            "app_name": self.app_name.text(),
+            "version": self.version.text(),
+            "author": self.author.text(),
+            "translator": self.translator.text(),
+        }
+
+    def get_po_header(self, locale, header_fields=None):
         """Generate a PO file header for the given locale.
         
         For Python projects, returns a standard gettext PO file header.
@@ -472,22 +624,16 @@ class SetupTranslationProjectWindow(SmartDialog):
         
         Args:
             locale: Locale code
+            header_fields: Optional result of _po_header_fields, to reuse across locales
             
         Returns:
             str: PO file header for Python projects, empty string for Ruby projects
         """
         if self.project_type == ProjectType.PYTHON.value:
             # Python projects: return standard PO file header
-            return f'''msgid ""
-msgstr ""
-"Project-Id-Version: {self.app_name.text()} {self.version.text()}\\n"
-"Language: {locale}\\n"
-"MIME-Version: 1.0\\n"
-"Content-Type: text/plain; charset=UTF-8\\n"
-"Content-Transfer-Encoding: 8bit\\n"
-"First-Author: {self.author.text()}\\n"
-"Last-Translator: {self.translator.text()}\\n"
-'''
+            if header_fields is None:
+                header_fields = self._po_header_fields()
+            return _PO_HEADER_TEMPLATE.format(locale=locale, **header_fields)
 
         # Ruby/Java/JavaScript projects don't use PO headers directly
         # but those are handled separately. Return empty string for now.
@@ -1,5 +1,6 @@
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QFrame
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QGridLayout, QLabel, QFrame
 
 from i18n.translation_manager_results import TranslationManagerResults
 from ui.app_style import AppStyle
@@ -10,33 +11,56 @@ logger = get_logger("stats_widget")
 
 _ = I18N._
 
+# Base stylesheet for the numeric value labels; a color is appended for the colored counts
+_VALUE_QSS = "font-size: 16px; font-weight: bold;"
+
+
 class StatsWidget(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
         AppStyle.sync_theme_from_widget(self)
         self.colors = AppStyle.get_stats_widget_colors()
+        # Both widget stylesheets are built once; setStyleSheet re-polishes every child, so it
+        # is only called when the style actually switches (see _apply_style)
+        self._default_qss = self._widget_qss(self.colors["default_bg"], self.colors["default_border"])
+        self._success_qss = self._widget_qss(self.colors["success_bg"], self.colors["success_border"])
+        self._current_qss = None
+        # Colored value label stylesheets, keyed by color role
+        self._value_qss = {
+            role: f"{_VALUE_QSS} color: {self.colors[role]};" for role in ("success", "warning", "error")
+        }
+        # Counts last shown by update_stats; None while placeholders are displayed
+        self._last_counts = None
+        # request_update_stats coalesces bursts of results into one update_stats call
+        self._pending_results = None
+        self._update_timer = QTimer(self)
+        self._update_timer.setSingleShot(True)
+        self._update_timer.setInterval(50)
+        self._update_timer.timeout.connect(self._flush_pending_stats)
         self.setup_ui()
         self._apply_default_style()
 
-    def _apply_default_style(self):
-        self.setStyleSheet(f"""
+    @staticmethod
+    def _widget_qss(background: str, border: str) -> str:
+        return f"""
             QWidget {{
-                background-color: {self.colors["default_bg"]};
-                border: 1px solid {self.colors["default_border"]};
+                background-color: {background};
+                border: 1px solid {border};
                 border-radius: 4px;
                 padding: 10px;
             }}
-        """)
+        """
+
+    def _apply_style(self, qss: str):
+        if qss is not self._current_qss:
+            self.setStyleSheet(qss)
+            self._current_qss = qss
+
+    def _apply_default_style(self):
+        self._apply_style(self._default_qss)
 
     def _apply_success_style(self):
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {self.colors["success_bg"]};
-                border: 1px solid {self.colors["success_border"]};
-                border-radius: 4px;
-                padding: 10px;
-            }}
-        """)
+        self._apply_style(self._success_qss)
         
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -51,148 +75,105 @@ class StatsWidget(QWidget):
         title.setStyleSheet("font-weight: bold; font-size: 14px;")
         frame_layout.addWidget(title)
         
-        # Stats grid
-        stats_layout = QHBoxLayout()
-        
-        # Total translations
-        total_translations_layout = QVBoxLayout()
-        self.total_translations_label = QLabel(_("Total Translations:"))
-        self.total_translations_value = QLabel("-")
-        self.total_translations_value.setStyleSheet("font-size: 16px; font-weight: bold;")
-        total_translations_layout.addWidget(self.total_translations_label)
-        total_translations_layout.addWidget(self.total_translations_value)
-        stats_layout.addLayout(total_translations_layout)
-        
-        # Total locales
-        total_locales_layout = QVBoxLayout()
-        self.total_locales_label = QLabel(_("Total Locales:"))
-        self.total_locales_value = QLabel("-")
-        self.total_locales_value.setStyleSheet("font-size: 16px; font-weight: bold;")
-        total_locales_layout.addWidget(self.total_locales_label)
-        total_locales_layout.addWidget(self.total_locales_value)
-        stats_layout.addLayout(total_locales_layout)
-        
-        # Missing translations
-        missing_translations_layout = QVBoxLayout()
-        self.missing_translations_label = QLabel(_("Missing Translations:"))
-        self.missing_translations_value = QLabel("-")
-        self.missing_translations_value.setStyleSheet("font-size: 16px; font-weight: bold;")
-        missing_translations_layout.addWidget(self.missing_translations_label)
-        missing_translations_layout.addWidget(self.missing_translations_value)
-        stats_layout.addLayout(missing_translations_layout)
-        
-        # Invalid Unicode translations
-        invalid_unicode_layout = QVBoxLayout()
-        self.invalid_unicode_label = QLabel(_("Invalid Unicode:"))
-        self.invalid_unicode_value = QLabel("-")
-        self.invalid_unicode_value.setStyleSheet("font-size: 16px; font-weight: bold;")
-        invalid_unicode_layout.addWidget(self.invalid_unicode_label)
-        invalid_unicode_layout.addWidget(self.invalid_unicode_value)
-        stats_layout.addLayout(invalid_unicode_layout)
-        
-        # Invalid indices translations
-        invalid_indices_layout = QVBoxLayout()
-        self.invalid_indices_label = QLabel(_("Invalid Indices:"))
-        self.invalid_indices_value = QLabel("-")
-        self.invalid_indices_value.setStyleSheet("font-size: 16px; font-weight: bold;")
-        invalid_indices_layout.addWidget(self.invalid_indices_label)
-        invalid_indices_layout.addWidget(self.invalid_indices_value)
-        stats_layout.addLayout(invalid_indices_layout)
-        
-        # Invalid braces translations
-        invalid_braces_layout = QVBoxLayout()
-        self.invalid_braces_label = QLabel(_("Invalid Braces:"))
-        self.invalid_braces_value = QLabel("-")
-        self.invalid_braces_value.setStyleSheet("font-size: 16px; font-weight: bold;")
-        invalid_braces_layout.addWidget(self.invalid_braces_label)
-        invalid_braces_layout.addWidget(self.invalid_braces_value)
-        stats_layout.addLayout(invalid_braces_layout)
-        
-        # Invalid leading space translations
-        invalid_leading_space_layout = QVBoxLayout()
-        self.invalid_leading_space_label = QLabel(_("Invalid Leading Space:"))
-        self.invalid_leading_space_value = QLabel("-")
-        self.invalid_leading_space_value.setStyleSheet("font-size: 16px; font-weight: bold;")
-        invalid_leading_space_layout.addWidget(self.invalid_leading_space_label)
-        invalid_leading_space_layout.addWidget(self.invalid_leading_space_value)
-        stats_layout.addLayout(invalid_leading_space_layout)
-        
-        # Invalid newline translations
-        invalid_newline_layout = QVBoxLayout()
-        self.invalid_newline_label = QLabel(_("Invalid Newline:"))
-        self.invalid_newline_value = QLabel("-")
-        self.invalid_newline_value.setStyleSheet("font-size: 16px; font-weight: bold;")
-        invalid_newline_layout.addWidget(self.invalid_newline_label)
-        invalid_newline_layout.addWidget(self.invalid_newline_value)
-        stats_layout.addLayout(invalid_newline_layout)
-
-        # Invalid character-set profile for locale expectation
-        invalid_character_set_layout = QVBoxLayout()
-        self.invalid_character_set_label = QLabel(_("Invalid Character Set:"))
-        self.invalid_character_set_value = QLabel("-")
-        self.invalid_character_set_value.setStyleSheet("font-size: 16px; font-weight: bold;")
-        invalid_character_set_layout.addWidget(self.invalid_character_set_label)
-        invalid_character_set_layout.addWidget(self.invalid_character_set_value)
-        stats_layout.addLayout(invalid_character_set_layout)
-        
-        # Stale translations
-        stale_translations_layout = QVBoxLayout()
-        self.stale_translations_label = QLabel(_("Stale Translations:"))
-        self.stale_translations_value = QLabel("-")
-        self.stale_translations_value.setStyleSheet("font-size: 16px; font-weight: bold;")
-        stale_translations_layout.addWidget(self.stale_translations_label)
-        stale_translations_layout.addWidget(self.stale_translations_value)
-        stats_layout.addLayout(stale_translations_layout)
+        # Stats grid: one title/value column per metric, exposed as <name>_label / <name>_value
+        stats_layout = QGridLayout()
+        stats_layout.setSpacing(8)
+        metrics = (
+            ("total_translations", _("Total Translations:")),
+            ("total_locales", _("Total Locales:")),
+            ("missing_translations", _("Missing Translations:")),
+            ("invalid_unicode", _("Invalid Unicode:")),
+            ("invalid_indices", _("Invalid Indices:")),
+            ("invalid_braces", _("Invalid Braces:")),
+            ("invalid_leading_space", _("Invalid Leading Space:")),
+            ("invalid_newline", _("Invalid Newline:")),
+            # Invalid character-set profile for locale expectation
+            ("invalid_character_set", _("Invalid Character Set:")),
+            ("stale_translations", _("Stale Translations:")),
+        )
+        self._value_labels = []
+        # Text and stylesheet last given to each value label, so unchanged values skip the Qt setters
+        self._label_texts = {}
+        self._label_qss = {}
+        for column, (name, title_text) in enumerate(metrics):
+            title_label = QLabel(title_text)
+            value_label = QLabel("-")
+            # Values are plain numbers; skip Qt's rich-text detection on every setText
+            value_label.setTextFormat(Qt.TextFormat.PlainText)
+            value_label.setStyleSheet(_VALUE_QSS)
+            stats_layout.addWidget(title_label, 0, column)
+            stats_layout.addWidget(value_label, 1, column)
+            setattr(self, f"{name}_label", title_label)
+            setattr(self, f"{name}_value", value_label)
+            self._value_labels.append(value_label)
+            self._label_texts[value_label] = "-"
+            self._label_qss[value_label] = _VALUE_QSS
         
         frame_layout.addLayout(stats_layout)
         layout.addWidget(frame)
-        self._value_labels = [
-            self.total_translations_value,
-            self.total_locales_value,
-            self.missing_translations_value,
-            self.invalid_unicode_value,
-            self.invalid_indices_value,
-            self.invalid_braces_value,
-            self.invalid_leading_space_value,
-            self.invalid_newline_value,
-            self.invalid_character_set_value,
-            self.stale_translations_value,
-        ]
 
-    def _set_value_style(self, label: QLabel, color: str | None = None):
-        style = "font-size: 16px; font-weight: bold;"
-        if color:
-            style += f" color: {color};"
-        label.setStyleSheet(style)
+    def _set_value(self, label: QLabel, text: str, style: str = _VALUE_QSS):
+        if self._label_texts[label] != text:
+            label.setText(text)
+            self._label_texts[label] = text
+        # Re-setting an identical stylesheet still re-polishes the label
+        if self._label_qss[label] != style:
+            label.setStyleSheet(style)
+            self._label_qss[label] = style
 
     def set_loading_state(self):
         """Show unknown/refreshing stats while a task is running."""
+        # A queued result from before the refresh started must not overwrite the placeholders
+        self._update_timer.stop()
+        self._pending_results = None
+        self._last_counts = None
         self._apply_default_style()
         for label in self._value_labels:
-            label.setText("-")
-            self._set_value_style(label)
+            self._set_value(label, "-")
 
     def clear_stats(self):
         """Reset stats to neutral placeholders."""
         self.set_loading_state()
 
+    def request_update_stats(self, results: TranslationManagerResults):
+        """Schedule a statistics update; results arriving in quick succession replace each other.
+
+        Nothing is drawn while the widget is hidden; the latest results are shown once it is.
+        """
+        self._pending_results = results
+        # While hidden the latest results are only kept; showEvent schedules them
+        if self.isVisible():
+            self._update_timer.start()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pending_results is not None:
+            self._update_timer.start()
+
+    def _flush_pending_stats(self):
+        results, self._pending_results = self._pending_results, None
+        if results is not None:
+            self.update_stats(results)
+
     def update_stats(self, results: TranslationManagerResults):
         """Update the statistics display.
         
         Args:
             results: TranslationManagerResults object containing all translation data
         """
+        # Label text/style changes are collected into a single repaint when updates resume
+        self.setUpdatesEnabled(False)
+        try:
+            self._show_stats(results)
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def _show_stats(self, results: TranslationManagerResults):
         # Calculate basic stats
         total_translations = results.total_strings
         total_locales = results.total_locales
 
-        # Update basic stats
-        self.total_translations_value.setText(str(total_translations))
-        self.total_locales_value.setText(str(total_locales))
-        self._set_value_style(self.total_translations_value)
-        self._set_value_style(self.total_locales_value)
-        
-        # Calculate counts from invalid_groups
+        # Calculate counts from invalid_groups; they are cached there and shared by every consumer
         missing_count = 0
         invalid_unicode_count = 0
         invalid_indices_count = 0
@@ -201,84 +182,50 @@ class StatsWidget(QWidget):
         invalid_newline_count = 0
         invalid_character_set_count = 0
         stale_count = 0
-        if results.invalid_groups:
-            invalid_groups = results.invalid_groups
-            missing_count = sum(len(locales) for _, locales in invalid_groups.missing_locale_groups)
-            invalid_unicode_count = sum(len(locales) for _, locales in invalid_groups.invalid_unicode_locale_groups)
-            invalid_indices_count = sum(len(locales) for _, locales in invalid_groups.invalid_index_locale_groups)
-            invalid_braces_count = sum(len(locales) for _, locales in invalid_groups.invalid_brace_locale_groups)
-            invalid_leading_space_count = sum(len(locales) for _, locales in invalid_groups.invalid_leading_space_locale_groups)
-            invalid_newline_count = sum(len(locales) for _, locales in invalid_groups.invalid_newline_locale_groups)
-            invalid_character_set_count = sum(
-                len(locales) for _, locales in invalid_groups.invalid_character_set_locale_groups
-            )
-            stale_count = len(invalid_groups.not_in_base)
+        invalid_groups = results.invalid_groups
+        if invalid_groups:
+            missing_count = invalid_groups.missing_count
+            invalid_unicode_count = invalid_groups.invalid_unicode_count
+            invalid_indices_count = invalid_groups.invalid_indices_count
+            invalid_braces_count = invalid_groups.invalid_braces_count
+            invalid_leading_space_count = invalid_groups.invalid_leading_space_count
+            invalid_newline_count = invalid_groups.invalid_newline_count
+            invalid_character_set_count = invalid_groups.invalid_character_set_count
+            stale_count = invalid_groups.stale_count
 
         logger.debug(f"Calculated stats - total_translations: {total_translations}, "
                     f"total_locales: {total_locales}, missing_translations: {missing_count}")
 
-        # Update missing translations with color
+        # Refreshes that produce the same numbers leave every label as it is
+        counts = (
+            total_translations, total_locales, missing_count, invalid_unicode_count,
+            invalid_indices_count, invalid_braces_count, invalid_leading_space_count,
+            invalid_newline_count, invalid_character_set_count, stale_count,
+        )
+        if counts == self._last_counts:
+            return
+        self._last_counts = counts
+
+        # Update basic stats
+        self._set_value(self.total_translations_value, str(total_translations))
+        self._set_value(self.total_locales_value, str(total_locales))
+
+        # Problem counts show in the success color at zero, otherwise in their problem color
+        colored_counts = (
+            (self.missing_translations_value, missing_count, "error"),
+            (self.invalid_unicode_value, invalid_unicode_count, "error"),
+            (self.invalid_indices_value, invalid_indices_count, "error"),
+            (self.invalid_braces_value, invalid_braces_count, "warning"),
+            (self.invalid_leading_space_value, invalid_leading_space_count, "warning"),
+            (self.invalid_newline_value, invalid_newline_count, "warning"),
+            (self.invalid_character_set_value, invalid_character_set_count, "warning"),
+            (self.stale_translations_value, stale_count, "warning"),
+        )
+        for label, count, problem_color in colored_counts:
+            self._set_value(label, str(count), self._value_qss["success" if count == 0 else problem_color])
+
+        # The whole widget turns green once nothing is missing
         if missing_count == 0:
-            self.missing_translations_value.setText(str(missing_count))
-            self._set_value_style(self.missing_translations_value, self.colors["success"])
             self._apply_success_style()
         else:
-            self.missing_translations_value.setText(f"{missing_count}")
-            self._set_value_style(self.missing_translations_value, self.colors["error"])
             self._apply_default_style()
-            
-        # Update invalid Unicode with color
-        if invalid_unicode_count == 0:
-            self.invalid_unicode_value.setText(str(invalid_unicode_count))
-            self._set_value_style(self.invalid_unicode_value, self.colors["success"])
-        else:
-            self.invalid_unicode_value.setText(f"{invalid_unicode_count}")
-            self._set_value_style(self.invalid_unicode_value, self.colors["error"])
-            
-        # Update invalid indices with color
-        if invalid_indices_count == 0:
-            self.invalid_indices_value.setText(str(invalid_indices_count))
-            self._set_value_style(self.invalid_indices_value, self.colors["success"])
-        else:
-            self.invalid_indices_value.setText(f"{invalid_indices_count}")
-            self._set_value_style(self.invalid_indices_value, self.colors["error"])
-            
-        # Update invalid braces with color
-        if invalid_braces_count == 0:
-            self.invalid_braces_value.setText(str(invalid_braces_count))
-            self._set_value_style(self.invalid_braces_value, self.colors["success"])
-        else:
-            self.invalid_braces_value.setText(f"{invalid_braces_count}")
-            self._set_value_style(self.invalid_braces_value, self.colors["warning"])
-            
-        # Update invalid leading space with color
-        if invalid_leading_space_count == 0:
-            self.invalid_leading_space_value.setText(str(invalid_leading_space_count))
-            self._set_value_style(self.invalid_leading_space_value, self.colors["success"])
-        else:
-            self.invalid_leading_space_value.setText(f"{invalid_leading_space_count}")
-            self._set_value_style(self.invalid_leading_space_value, self.colors["warning"])
-            
-        # Update invalid newline with color
-        if invalid_newline_count == 0:
-            self.invalid_newline_value.setText(str(invalid_newline_count))
-            self._set_value_style(self.invalid_newline_value, self.colors["success"])
-        else:
-            self.invalid_newline_value.setText(f"{invalid_newline_count}")
-            self._set_value_style(self.invalid_newline_value, self.colors["warning"])
-
-        # Update invalid character-set count with color
-        if invalid_character_set_count == 0:
-            self.invalid_character_set_value.setText(str(invalid_character_set_count))
-            self._set_value_style(self.invalid_character_set_value, self.colors["success"])
-        else:
-            self.invalid_character_set_value.setText(f"{invalid_character_set_count}")
-            self._set_value_style(self.invalid_character_set_value, self.colors["warning"])
-            
-        # Update stale translations with color
-        if stale_count == 0:
-            self.stale_translations_value.setText(str(stale_count))
-            self._set_value_style(self.stale_translations_value, self.colors["success"])
-        else:
-            self.stale_translations_value.setText(str(stale_count))
-            self._set_value_style(self.stale_translations_value, self.colors["warning"])
\ No newline at end of file
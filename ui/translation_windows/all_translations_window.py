@@ -253,9 +253,7 @@ class AllTranslationsWindow(BaseTranslationWindow):
                 self.table.setItem(row, col, item)
 
         # Start every column at its minimum width; user can resize to make them wider
-        self.table.setColumnWidth(0, KEY_COLUMN_MIN_WIDTH)
-        for col in range(1, self.table.columnCount()):
-            self.table.setColumnWidth(col, OTHER_COLUMN_MIN_WIDTH)
+        self._reset_column_widths(KEY_COLUMN_MIN_WIDTH, OTHER_COLUMN_MIN_WIDTH)
 
         self._populate_context_filter_combo()
 
@@ -434,20 +432,6 @@ class AllTranslationsWindow(BaseTranslationWindow):
             if self.table.isRowHidden(row) != hide:
                 self.table.setRowHidden(row, hide)
 
-    def _with_table_updates_blocked(self, action) -> None:
-        """Run ``action`` with main + frozen table repaints suspended."""
-        table = self.table
-        frozen = getattr(table, "_frozen_table", None)
-        table.setUpdatesEnabled(False)
-        if frozen is not None:
-            frozen.setUpdatesEnabled(False)
-        try:
-            action()
-        finally:
-            if frozen is not None:
-                frozen.setUpdatesEnabled(True)
-            table.setUpdatesEnabled(True)
-
     def show_context_menu(self, position):
         """Show context menu for copy/delete actions."""
         item = self.table.itemAt(position)
@@ -79,6 +79,71 @@ class BaseTranslationWindow(SmartWindow):
         """
         configure_translation_table_column_widths(self.table, num_locales)
 
+    def _reset_column_widths(self, key_width: int, other_width: int) -> None:
+        """Set column 0 to ``key_width`` and every locale column to ``other_width``.
+
+        Only column 0 resizes have listeners beyond the view itself (frozen overlay, key-column
+        clamps), so locale columns are resized with header signals blocked, skipping any already
+        at ``other_width``, and the view's geometry is refreshed once afterwards.
+        """
+        table = self.table
+        table.setColumnWidth(0, key_width)
+        header = table.horizontalHeader()
+        resized = False
+        signals_were_blocked = header.blockSignals(True)
+        try:
+            for col in range(1, table.columnCount()):
+                if header.sectionSize(col) != other_width:
+                    header.resizeSection(col, other_width)
+                    resized = True
+        finally:
+            header.blockSignals(signals_were_blocked)
+        if resized:
+            table.updateGeometries()
+            table.viewport().update()
+
+    def _with_table_updates_blocked(self, action, block_signals: bool = False) -> None:
+        """Run ``action`` with main + frozen table repaints suspended.
+
+        With ``block_signals`` the table's own signals (``itemChanged`` etc.) are also
+        suppressed, for bulk population where per-cell notifications are pure overhead.
+        """
+        table = self.table
+        frozen = getattr(table, "_frozen_table", None)
+        table.setUpdatesEnabled(False)
+        if frozen is not None:
+            frozen.setUpdatesEnabled(False)
+        signals_were_blocked = table.blockSignals(True) if block_signals else None
+        try:
+            action()
+        finally:
+            if block_signals:
+                table.blockSignals(signals_were_blocked)
+            if frozen is not None:
+                frozen.setUpdatesEnabled(True)
+            table.setUpdatesEnabled(True)
+
+    def _with_cell_text_batched(self, action) -> None:
+        """Run ``action`` (in-place cell text edits only) and notify views with one ``dataChanged``.
+
+        The model's per-item ``dataChanged`` emissions are suppressed while ``action`` runs; a
+        single range covering every cell is emitted afterwards, so the main and frozen views
+        refresh once instead of once per edited cell. Not for actions that add/remove rows.
+        """
+        model = self.table.model()
+
+        def run_with_model_signals_blocked():
+            model_signals_were_blocked = model.blockSignals(True)
+            try:
+                action()
+            finally:
+                model.blockSignals(model_signals_were_blocked)
+
+        self._with_table_updates_blocked(run_with_model_signals_blocked, block_signals=True)
+        rows, cols = model.rowCount(), model.columnCount()
+        if rows and cols:
+            model.dataChanged.emit(model.index(0, 0), model.index(rows - 1, cols - 1))
+
     def get_key_from_row(self, row):
         """Get translation key object from first-column UserRole (fallback to text)."""
         item = self.table.item(row, 0)
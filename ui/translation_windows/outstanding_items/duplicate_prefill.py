@@ -8,6 +8,8 @@ refreshes.
 
 from __future__ import annotations
 
+from itertools import product
+
 from PyQt6.QtWidgets import QMessageBox
 
 from utils.globals import config_manager
@@ -16,15 +18,19 @@ from utils.translations import I18N
 _ = I18N._
 
 
-def detect_duplicate_values(translations, locales, ignore_patterns=()):
+def detect_duplicate_values(translations, locales, ignore_patterns=(), default_locale=None):
     """Detect duplicate translation values in the default locale.
 
+    ``default_locale`` defaults to the configured ``translation.default_locale``; callers that
+    already resolved it can pass it through.
+
     Returns:
         tuple: (existing_to_outstanding_matches, outstanding_duplicates)
             - existing_to_outstanding_matches: dict mapping default_value to list of (existing_msgid, outstanding_msgid) tuples
             - outstanding_duplicates: dict mapping default_value to list of outstanding msgids
     """
-    default_locale = config_manager.get('translation.default_locale', 'en')
+    if default_locale is None:
+        default_locale = config_manager.get('translation.default_locale', 'en')
 
     # Build map of default locale values to translation keys (normalized text; lists use join)
     value_to_keys = {}
@@ -65,9 +71,8 @@ def detect_duplicate_values(translations, locales, ignore_patterns=()):
                 has_existing_translations = False
                 for locale in locales:
                     if locale != default_locale:
-                        if locale in group.values and group.value_as_text(
-                            group.values[locale]
-                        ).strip():
+                        value = group.values.get(locale)
+                        if value and group.value_as_text(value).strip():
                             has_existing_translations = True
                             break
 
@@ -78,11 +83,9 @@ def detect_duplicate_values(translations, locales, ignore_patterns=()):
 
             # If we have both existing and outstanding, create matches
             if existing_keys and outstanding_keys_for_value:
-                if default_value not in existing_to_outstanding_matches:
-                    existing_to_outstanding_matches[default_value] = []
-                for outstanding_key in outstanding_keys_for_value:
-                    for existing_key in existing_keys:
-                        existing_to_outstanding_matches[default_value].append((existing_key, outstanding_key))
+                existing_to_outstanding_matches.setdefault(default_value, []).extend(
+                    product(existing_keys, outstanding_keys_for_value)
+                )
 
             # If we have multiple outstanding with same value, track them
             if len(outstanding_keys_for_value) > 1:
@@ -19,8 +19,12 @@ _ = I18N._
 logger = get_logger(__name__)
 
 
+# Tabs and line breaks would break the TSV row/column shape
+_TSV_TRANS = str.maketrans({"\t": " ", "\r": " ", "\n": " "})
+
+
 def sanitize_export_text(value):
-    return str(value or "").replace("\t", " ").replace("\r", " ").replace("\n", " ")
+    return str(value or "").translate(_TSV_TRANS)
 
 
 def truncate_export_text(value, max_len=280):
@@ -53,13 +57,114 @@ def format_locale_value_pairs(group, locales_set, locales):
         return ""
     ordered = [loc for loc in locales if loc in locales_set]
     extras = sorted([loc for loc in locales_set if loc not in locales])
+    return _format_ordered_value_pairs(group, ordered + extras)
+
+
+def _format_ordered_value_pairs(group, ordered_locales):
     values = []
-    for locale in ordered + extras:
+    for locale in ordered_locales:
         text = group.get_translation_as_text(locale)
         values.append(f"{locale}={sanitize_export_text(text)}")
     return " | ".join(values)
 
 
+class _LocaleMasks:
+    """Assigns each locale a bit so per-row locale buckets can be built as int masks.
+
+    Bits follow the order of ``locales``; locales outside it get bits on first sight and are
+    listed after the known ones, sorted, matching format_locale_list.
+    """
+
+    def __init__(self, locales):
+        # dict.fromkeys drops repeated locales, so bit numbers stay dense
+        self._locale_for_bit = list(dict.fromkeys(locales))
+        self._bits = {loc: bit for bit, loc in enumerate(self._locale_for_bit)}
+        self._known_count = len(self._locale_for_bit)
+
+    def flag(self, locale):
+        bit = self._bits.get(locale)
+        if bit is None:
+            bit = self._bits[locale] = len(self._locale_for_bit)
+            self._locale_for_bit.append(locale)
+        return 1 << bit
+
+    def mask(self, locale_codes):
+        mask = 0
+        for locale in locale_codes:
+            mask |= self.flag(locale)
+        return mask
+
+    def ordered(self, mask):
+        known = []
+        extras = []
+        bit = 0
+        while mask:
+            if mask & 1:
+                (known if bit < self._known_count else extras).append(self._locale_for_bit[bit])
+            mask >>= 1
+            bit += 1
+        if extras:
+            known.extend(sorted(extras))
+        return known
+
+    def format(self, mask):
+        return ", ".join(self.ordered(mask)) if mask else ""
+
+
+def _build_export_row(invalid_locales, group, masks, locale_flags, default_locale, default_flag):
+    """Build one outstanding row's formatted cells.
+
+    Returns:
+        tuple: (markdown_row, invalid_locale_values) -- the per-header cell text (every header
+            except "Invalid Locale Values") and the untruncated invalid locale values text.
+    """
+    # Keep Invalid Unicode aligned with current outstanding UI behavior
+    # where invalid indices are grouped as critical with unicode.
+    invalid_unicode = masks.mask(invalid_locales.invalid_unicode_locales) | masks.mask(
+        invalid_locales.invalid_index_locales
+    )
+    missing = masks.mask(invalid_locales.missing_locales)
+    invalid_braces = masks.mask(invalid_locales.invalid_brace_locales)
+    invalid_leading_space = masks.mask(invalid_locales.invalid_leading_space_locales)
+    invalid_newline = masks.mask(invalid_locales.invalid_newline_locales)
+    invalid_character_set = masks.mask(invalid_locales.invalid_character_set_locales)
+
+    all_error_locales = (
+        missing
+        | invalid_unicode
+        | invalid_braces
+        | invalid_leading_space
+        | invalid_newline
+        | invalid_character_set
+    )
+
+    default_value = group.get_translation_as_text(default_locale)
+    defined_without_error = 0
+    for locale, flag in locale_flags:
+        if all_error_locales & flag:
+            continue
+        vt = group.value_as_text(group.get_translation(locale))
+        if vt and vt.strip():
+            defined_without_error |= flag
+    # Default locale is often not in `locales` list from header filtering in this window.
+    if default_value and default_value.strip() and not all_error_locales & default_flag:
+        defined_without_error |= default_flag
+
+    markdown_row = {
+        "Translation Key": group.key.msgid,
+        "Default Locale Value": default_value,
+        "Defined without Error": masks.format(defined_without_error),
+        "Missing": masks.format(missing),
+        "Invalid Unicode": masks.format(invalid_unicode),
+        "Invalid Braces": masks.format(invalid_braces),
+        "Invalid Leading Space": masks.format(invalid_leading_space),
+        "Invalid Newline": masks.format(invalid_newline),
+        "Invalid Character Set": masks.format(invalid_character_set),
+    }
+    invalid_locale_values = _format_ordered_value_pairs(group, masks.ordered(all_error_locales))
+    return markdown_row, invalid_locale_values
+
+
 def export_outstanding_to_tsv(parent, current_invalid_groups, project_path, locales):
     """Export the current outstanding rows and invalid locale buckets to a TSV file.
 
@@ -89,84 +194,11 @@ def export_outstanding_to_tsv(parent, current_invalid_groups, project_path, loca
     ]
     markdown_headers = [h for h in headers if h != "Invalid Locale Values"]
 
-    lines = ["\t".join(headers)]
     markdown_rows = []
     markdown_details = []
-
-    for _key, (invalid_locales, group) in current_invalid_groups.items():
-        # Keep Invalid Unicode aligned with current outstanding UI behavior
-        # where invalid indices are grouped as critical with unicode.
-        invalid_unicode = set(invalid_locales.invalid_unicode_locales) | set(invalid_locales.invalid_index_locales)
-        missing = set(invalid_locales.missing_locales)
-        invalid_braces = set(invalid_locales.invalid_brace_locales)
-        invalid_leading_space = set(invalid_locales.invalid_leading_space_locales)
-        invalid_newline = set(invalid_locales.invalid_newline_locales)
-        invalid_character_set = set(invalid_locales.invalid_character_set_locales)
-
-        all_error_locales = (
-            missing
-            | invalid_unicode
-            | invalid_braces
-            | invalid_leading_space
-            | invalid_newline
-            | invalid_character_set
-        )
-
-        default_value = group.get_translation_as_text(default_locale)
-        defined_without_error = set()
-        for locale in locales:
-            value = group.get_translation(locale)
-            vt = group.value_as_text(value)
-            if vt and vt.strip() and locale not in all_error_locales:
-                defined_without_error.add(locale)
-        # Default locale is often not in `locales` list from header filtering in this window.
-        if default_value and default_value.strip() and default_locale not in all_error_locales:
-            defined_without_error.add(default_locale)
-
-        invalid_locale_values = format_locale_value_pairs(group, all_error_locales, locales)
-        invalid_locale_values_tsv = truncate_export_text(invalid_locale_values)
-        row_values = [
-            group.key.msgid,
-            default_value,
-            format_locale_list(defined_without_error, locales),
-            format_locale_list(missing, locales),
-            format_locale_list(invalid_unicode, locales),
-            format_locale_list(invalid_braces, locales),
-            format_locale_list(invalid_leading_space, locales),
-            format_locale_list(invalid_newline, locales),
-            format_locale_list(invalid_character_set, locales),
-            invalid_locale_values_tsv,
-        ]
-        # Keep TSV shape stable (no tabs/newlines in cell content)
-        safe_values = [sanitize_export_text(v) for v in row_values]
-        lines.append("\t".join(safe_values))
-
-        markdown_rows.append(
-            {
-                "Translation Key": group.key.msgid,
-                "Default Locale Value": default_value,
-                "Defined without Error": format_locale_list(defined_without_error, locales),
-                "Missing": format_locale_list(missing, locales),
-                "Invalid Unicode": format_locale_list(invalid_unicode, locales),
-                "Invalid Braces": format_locale_list(invalid_braces, locales),
-                "Invalid Leading Space": format_locale_list(invalid_leading_space, locales),
-                "Invalid Newline": format_locale_list(invalid_newline, locales),
-                "Invalid Character Set": format_locale_list(invalid_character_set, locales),
-            }
-        )
-        markdown_details.append(
-            {
-                "key": group.key.msgid,
-                "default": default_value,
-                "missing": missing,
-                "invalid_unicode": invalid_unicode,
-                "invalid_braces": invalid_braces,
-                "invalid_leading_space": invalid_leading_space,
-                "invalid_newline": invalid_newline,
-                "invalid_character_set": invalid_character_set,
-                "group": group,
-            }
-        )
+    masks = _LocaleMasks(locales)
+    locale_flags = [(locale, masks.flag(locale)) for locale in locales]
+    default_flag = masks.flag(default_locale)
 
     default_name = os.path.join(project_path or "", "outstanding_translation_keys.tsv")
     dialog_result = QFileDialog.getSaveFileName(
@@ -180,8 +212,33 @@ def export_outstanding_to_tsv(parent, current_invalid_groups, project_path, loca
         return
 
     try:
+        # Rows are streamed straight to the TSV file rather than joined in memory first
         with open(file_path, 'w', encoding='utf-8', newline='\n') as f:
-            f.write("\n".join(lines) + "\n")
+            f.write("\t".join(headers) + "\n")
+            for _key, (invalid_locales, group) in current_invalid_groups.items():
+                markdown_row, invalid_locale_values = _build_export_row(
+                    invalid_locales, group, masks, locale_flags, default_locale, default_flag
+                )
+                row_values = [markdown_row[header] for header in markdown_headers]
+                row_values.append(truncate_export_text(invalid_locale_values))
+                # Keep TSV shape stable (no tabs/newlines in cell content)
+                safe_values = [sanitize_export_text(v) for v in row_values]
+                f.write("\t".join(safe_values) + "\n")
+
+                markdown_rows.append(markdown_row)
+                markdown_details.append(
+                    {
+                        "key": group.key.msgid,
+                        "default": markdown_row["Default Locale Value"],
+                        "missing": markdown_row["Missing"],
+                        "invalid_unicode": markdown_row["Invalid Unicode"],
+                        "invalid_braces": markdown_row["Invalid Braces"],
+                        "invalid_leading_space": markdown_row["Invalid Leading Space"],
+                        "invalid_newline": markdown_row["Invalid Newline"],
+                        "invalid_character_set": markdown_row["Invalid Character Set"],
+                        "invalid_locale_values": invalid_locale_values,
+                    }
+                )
 
         md_path = os.path.splitext(file_path)[0] + ".md"
         with open(md_path, "w", encoding="utf-8", newline="\n") as f:
@@ -209,13 +266,11 @@ def export_outstanding_to_tsv(parent, current_invalid_groups, project_path, loca
                     ("Invalid newline locales", detail["invalid_newline"]),
                     ("Invalid character-set locales", detail["invalid_character_set"]),
                 ]
-                for label, locales_set in category_rows:
-                    if locales_set:
-                        f.write(
-                            f"- {label}: {escape_markdown(format_locale_list(locales_set, locales))}\n"
-                        )
+                for label, locale_list_text in category_rows:
+                    if locale_list_text:
+                        f.write(f"- {label}: {escape_markdown(locale_list_text)}\n")
                 f.write(
-                    f"- Invalid locale values: {escape_markdown(format_locale_value_pairs(detail['group'], detail['missing'] | detail['invalid_unicode'] | detail['invalid_braces'] | detail['invalid_leading_space'] | detail['invalid_newline'] | detail['invalid_character_set'], locales))}\n\n"
+                    f"- Invalid locale values: {escape_markdown(detail['invalid_locale_values'])}\n\n"
                 )
 
         QMessageBox.information(
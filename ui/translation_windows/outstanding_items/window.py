@@ -1,11 +1,10 @@
 from PyQt6.QtWidgets import (QVBoxLayout, QHBoxLayout, QPushButton,
                             QLabel, QTableWidgetItem, QProgressBar,
                             QMessageBox, QCheckBox, QTextEdit, QStyledItemDelegate)
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer
-from PyQt6.QtGui import QShortcut, QKeySequence
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer
+from PyQt6.QtGui import QBrush, QShortcut, QKeySequence
 from PyQt6.QtWidgets import QApplication
-import random
-import string
+import secrets
 
 from ui.app_style import AppStyle
 from utils.globals import config_manager
@@ -35,6 +34,9 @@ logger = get_logger(__name__)
 # Minimum column widths: key column fits keys like "en.views.projects.created_at"; others slightly less
 KEY_COLUMN_MIN_WIDTH = 200
 OTHER_COLUMN_MIN_WIDTH = 120
+# Rows whose items are built as soon as the table is populated; the rest follow in chunks
+EAGER_POPULATE_ROW_COUNT = 200
+POPULATE_CHUNK_ROW_COUNT = 500
 
 
 def _format_eta_seconds(secs: float) -> str:
@@ -106,16 +108,35 @@ class OutstandingItemsWindow(BaseTranslationWindow):
         # resolve where a result belongs *now* instead of trusting a row index captured when the
         # queue was built (see translation_orchestrator.BackgroundTranslationController).
         self._key_to_row = {}
+        # row -> key and column -> locale, cached alongside the table so whole-table passes
+        # don't read them back from header/column-0 items (see _populate_table, load_data)
+        self._row_keys = []
+        self._display_locales = []
         self._prefill = DuplicatePrefillState()
+        # (invalid_groups, display_locales) for a table population deferred while hidden
+        self._pending_population = None
+        # [entries, next_row, display_locales, cell_styles] for rows not yet given items
+        self._pending_rows = None
+        # Highlight brushes cached per theme name (see _get_highlight_brushes)
+        self._highlight_brushes = None
+        self._highlight_brushes_theme = None
 
         self.setup_properties()
         self.setup_ui()
 
     def setup_properties(self):
         self.setup_translation_service(self.project_path)
+        # Set once the service has been used for a translation; save_changes only tears down
+        # and rebuilds the service (executor, LLM loop) when this is set.
+        self._translation_service_dirty = False
         self.is_translating = False
         self._translation_controller = None
         self._batch_eta = None
+        # One ~60 Hz repaint for any burst of cell edits (see _schedule_viewport_update)
+        self._repaint_timer = QTimer(self)
+        self._repaint_timer.setSingleShot(True)
+        self._repaint_timer.setInterval(16)
+        self._repaint_timer.timeout.connect(self._flush_viewport_update)
 
     def closeEvent(self, event):
         """Handle cleanup when the window is closed."""
@@ -345,7 +366,7 @@ class OutstandingItemsWindow(BaseTranslationWindow):
             )
             return
 
-        QTimer.singleShot(0, lambda: self.table.viewport().update())
+        self._schedule_viewport_update()
 
     def delete_translation_group_for_row(self, row: int):
         """Delete translation group represented by a table row."""
@@ -448,12 +469,20 @@ class OutstandingItemsWindow(BaseTranslationWindow):
         self.table.horizontalHeader().setMinimumSectionSize(OTHER_COLUMN_MIN_WIDTH)
         self.table.horizontalHeader().setMaximumSectionSize(800)
 
+    def _column_locales(self):
+        """Locale codes of the translation columns, in column order (column 1 onwards)."""
+        return self._display_locales
+
     def _translation_key_for_row(self, row):
         return self._get_key_from_row(row)
 
     def _get_translations_catalog(self):
         return self.translations
 
+    def translate_table_cell(self, row, col, key, locale, use_llm=False):
+        self._translation_service_dirty = True
+        super().translate_table_cell(row, col, key, locale, use_llm=use_llm)
+
     def _get_key_from_row(self, row):
         """Extract the translation key from a table row (stored in UserRole when populated).
         Falls back to display text for backward compatibility (e.g. Ruby where key is string).
@@ -465,6 +494,9 @@ class OutstandingItemsWindow(BaseTranslationWindow):
             The translation key (str for Ruby, (context, msgid) for Python with context)
         """
         item = self.table.item(row, 0)
+        if item is None and self._pending_rows is not None:
+            self._flush_pending_rows()
+            item = self.table.item(row, 0)
         key = item.data(Qt.ItemDataRole.UserRole) if item else None
         if key is not None:
             return key
@@ -487,6 +519,7 @@ class OutstandingItemsWindow(BaseTranslationWindow):
         # only used here to discover what's currently missing; results are addressed by key, not
         # row, so this snapshot doesn't go stale if the table's rows shift mid-batch (see
         # translation_orchestrator.py).
+        self._flush_pending_rows()
         row_entries = []  # (key, source_text, [(col, locale), ...])
         for row in range(self.table.rowCount()):
             key = self._get_key_from_row(row)
@@ -662,8 +695,19 @@ class OutstandingItemsWindow(BaseTranslationWindow):
         """Handle a completed translation."""
         item = QTableWidgetItem(translated_text)
         self.table.setItem(row, col, item)
-        # Force UI update
-        QTimer.singleShot(0, lambda: self.table.viewport().update())
+        self._schedule_viewport_update()
+
+    def _schedule_viewport_update(self):
+        """Force a UI update, coalesced so a burst of edits repaints at most once per frame.
+
+        The timer is deliberately not restarted while active, so a steady stream of batch
+        results still repaints every 16ms instead of waiting for the stream to pause.
+        """
+        if not self._repaint_timer.isActive():
+            self._repaint_timer.start()
+
+    def _flush_viewport_update(self):
+        self.table.viewport().update()
 
     def _reset_batch_controls(self):
         """Re-enable buttons and hide the inline progress strip.
@@ -689,6 +733,7 @@ class OutstandingItemsWindow(BaseTranslationWindow):
     def _on_translation_finished(self):
         """Handle when translation process is finished."""
         self._reset_batch_controls()
+        self._translation_service_dirty = True
         # Dropping this reference here (rather than waiting for the QThread to actually stop) is
         # safe: the controller is parented to this window, so it stays alive regardless, and it
         # drops/cleans up its own QThread/worker independently once thread.finished proves they
@@ -765,7 +810,7 @@ class OutstandingItemsWindow(BaseTranslationWindow):
             self, self._current_invalid_groups, self.project_path, self.locales
         )
 
-    def load_data(self, translations, locales, skip_duplicate_prompt=False):
+    def load_data(self, translations, locales, skip_duplicate_prompt=False, defer_if_hidden=False):
         """Load translation data into the table.
 
         translations is the manager's in-memory dict (by reference). Choosing "Yes"
@@ -774,6 +819,9 @@ class OutstandingItemsWindow(BaseTranslationWindow):
         saving. The window itself is a view only—each open calls load_data with the
         current manager state, so it does not hold persistent dirty state.
 
+        With defer_if_hidden, a hidden window only recomputes the outstanding groups; the
+        table itself is repopulated from them in showEvent.
+
         Returns:
             bool: True if there are items to display (caller should open the window),
                   False if nothing to show (e.g. user chose Cancel, or all resolved).
@@ -792,6 +840,7 @@ class OutstandingItemsWindow(BaseTranslationWindow):
         self.table.setColumnCount(len(display_locales) + 1)
         headers = ["Translation Key"] + display_locales
         self.table.setHorizontalHeaderLabels(headers)
+        self._display_locales = display_locales
 
         # Set dynamic column widths based on number of locales
         self.set_dynamic_column_widths(len(display_locales))
@@ -818,7 +867,7 @@ class OutstandingItemsWindow(BaseTranslationWindow):
 
         # Detect duplicate values
         existing_to_outstanding_matches, outstanding_duplicates = detect_duplicate_values(
-            translations, locales, ignore_patterns=ignore_patterns
+            translations, locales, ignore_patterns=ignore_patterns, default_locale=default_locale
         )
 
         # Ask user once, then reuse the last choice for silent refreshes.
@@ -847,10 +896,8 @@ class OutstandingItemsWindow(BaseTranslationWindow):
 
                         # Copy translations from existing to outstanding for all non-default locales
                         for locale in display_locales:
-                            if locale in existing_group.values and existing_group.value_as_text(
-                                existing_group.values[locale]
-                            ).strip():
-                                new_value = existing_group.values[locale]
+                            new_value = existing_group.values.get(locale)
+                            if new_value and existing_group.value_as_text(new_value).strip():
                                 old_value = outstanding_group.get_translation(locale) or ""
                                 outstanding_group.add_translation(locale, new_value)
                                 if new_value != old_value:
@@ -859,46 +906,39 @@ class OutstandingItemsWindow(BaseTranslationWindow):
                                     pre_filled_keys.add(outstanding_key)
                 self._prefill.update_notice(self.prefill_notice_label)
 
-                # Track outstanding duplicates - we'll show only one of each group
-                for default_value, duplicate_keys in outstanding_duplicates.items():
-                    # Use the first key as the representative
-                    representative_key = duplicate_keys[0]
-                    # Store all matched keys
-                    self._prefill.outstanding_duplicate_groups[representative_key] = duplicate_keys
-                    logger.debug(f"Grouped duplicate outstanding translations: {representative_key} represents {duplicate_keys}")
-                    default_value_display = default_value[:50] + "..." if len(default_value) > 50 else default_value
-                    logger.debug(f"  Default value: '{default_value_display}'")
-                    logger.debug(f"  Will show only '{representative_key}' in table, apply to all {len(duplicate_keys)} keys on save")
-
-                # Re-check invalid translations after pre-filling (they may now be resolved)
-                all_invalid_groups = {}
-                for key, group in translations.items():
-                    if not group.is_in_base:
-                        continue
+                # Track outstanding duplicates - we'll show only one of each group, using the
+                # first key as the representative for all matched keys
+                self._prefill.outstanding_duplicate_groups.update(
+                    {duplicate_keys[0]: duplicate_keys for duplicate_keys in outstanding_duplicates.values()}
+                )
+                logger.debug(f"Grouped {len(outstanding_duplicates)} duplicate outstanding translation groups")
 
+                # Re-check invalid translations after pre-filling (they may now be resolved).
+                # Only pre-filled keys had values changed, so only those need revalidating.
+                for key in pre_filled_keys:
+                    group = translations[key]
                     invalid_locales = group.get_invalid_translations(
                         locales, ignore_patterns=ignore_patterns
                     )
                     if invalid_locales.has_errors:
                         all_invalid_groups[key] = (invalid_locales, group)
+                    else:
+                        all_invalid_groups.pop(key, None)
 
                 # Filter out duplicate outstanding translations (keep only representative)
-                filtered_invalid_groups = {}
-                excluded_keys = set()
-                for key, (invalid_locales, group) in all_invalid_groups.items():
-                    # Check if this key is part of a duplicate group (but not the representative)
-                    is_excluded = False
-                    for rep_key, matched_keys in self._prefill.outstanding_duplicate_groups.items():
-                        if key in matched_keys and key != rep_key:
-                            excluded_keys.add(key)
-                            is_excluded = True
-                            break
-
-                    if not is_excluded:
-                        filtered_invalid_groups[key] = (invalid_locales, group)
-
-                all_invalid_groups = filtered_invalid_groups
-                logger.info(f"Filtered out {len(excluded_keys)} duplicate outstanding translations")
+                excluded_keys = {
+                    key
+                    for rep_key, matched_keys in self._prefill.outstanding_duplicate_groups.items()
+                    for key in matched_keys
+                    if key != rep_key
+                }
+                unfiltered_count = len(all_invalid_groups)
+                all_invalid_groups = {
+                    k: v for k, v in all_invalid_groups.items() if k not in excluded_keys
+                }
+                logger.info(
+                    f"Filtered out {unfiltered_count - len(all_invalid_groups)} duplicate outstanding translations"
+                )
 
                 # If all outstanding translations were resolved by pre-filling, show success dialog
                 if len(all_invalid_groups) == 0:
@@ -919,18 +959,140 @@ class OutstandingItemsWindow(BaseTranslationWindow):
             # combine_reply == "no": fall through and open window with all items (no combining)
 
         self._current_invalid_groups = all_invalid_groups
-        self._key_to_row = {}
+        if defer_if_hidden and not self.isVisible():
+            self._pending_population = (all_invalid_groups, display_locales)
+        else:
+            self._pending_population = None
+            self._apply_table_population(all_invalid_groups, display_locales)
+
+        # Start every column at its minimum width; user can resize to make them wider
+        self._reset_column_widths(KEY_COLUMN_MIN_WIDTH, OTHER_COLUMN_MIN_WIDTH)
+        self._min_key_column_width = KEY_COLUMN_MIN_WIDTH
 
+        # Return True only when there are rows to display.
+        has_items = len(all_invalid_groups) > 0
+        if not has_items:
+            logger.debug("No outstanding items found after load_data")
+        return has_items
+
+    def showEvent(self, event):
+        """Populate the table if a reload was deferred while the window was hidden."""
+        pending = self._pending_population
+        if pending is not None:
+            self._pending_population = None
+            self._apply_table_population(*pending)
+        super().showEvent(event)
+
+    def _apply_table_population(self, all_invalid_groups, display_locales):
+        self._with_table_updates_blocked(
+            lambda: self._populate_table(all_invalid_groups, display_locales),
+            block_signals=True,
+        )
+
+    def _get_highlight_brushes(self):
+        """Return the (missing, critical, style) brushes, rebuilt only when the theme changes."""
         AppStyle.sync_theme_from_widget(self)
-        highlight_colors = AppStyle.get_translation_highlight_colors()
-        missing_color = highlight_colors["missing"]
-        critical_color = highlight_colors["critical"]
-        style_color = highlight_colors["style"]
+        theme = AppStyle.get_theme_name()
+        if self._highlight_brushes_theme != theme:
+            highlight_colors = AppStyle.get_translation_highlight_colors()
+            self._highlight_brushes = (
+                QBrush(highlight_colors["missing"]),
+                QBrush(highlight_colors["critical"]),
+                QBrush(highlight_colors["style"]),
+            )
+            self._highlight_brushes_theme = theme
+        return self._highlight_brushes
+
+    def _populate_table(self, all_invalid_groups, display_locales):
+        """Create the table items for ``all_invalid_groups`` (one row per outstanding key).
 
+        Only the first EAGER_POPULATE_ROW_COUNT rows get their items right away; the rest are
+        filled in chunks from the event loop (see _populate_next_row_chunk), so opening a huge
+        outstanding list doesn't wait on building every cell. Anything that reads the whole
+        table calls _flush_pending_rows first. A cell the user fills in before its row is built
+        keeps the user's item; the deferred build only creates the cells that are still empty.
+        """
+        # A new population supersedes whatever an earlier one still had queued
+        self._pending_rows = None
+        self._row_keys = list(all_invalid_groups)
+        self._key_to_row = {key: row for row, key in enumerate(self._row_keys)}
+
+        # One shared brush per highlight and one translated label per status for the whole
+        # load, rather than a QColor -> QBrush conversion and a translation lookup per cell.
+        cell_styles = self._get_highlight_brushes() + (
+            TranslationStatus.MISSING.get_translated_value(),
+            TranslationStatus.INVALID_UNICODE.get_translated_value(),
+            TranslationStatus.INVALID_INDICES.get_translated_value(),
+            TranslationStatus.INVALID_BRACES.get_translated_value(),
+            TranslationStatus.INVALID_LEADING_SPACE.get_translated_value(),
+            TranslationStatus.INVALID_NEWLINE.get_translated_value(),
+            TranslationStatus.INVALID_CHARACTER_SET.get_translated_value(),
+        )
+
+        # Drop the previous load's items so any item in a deferred row was put there since
+        self.table.clearContents()
         self.table.setRowCount(len(all_invalid_groups))
 
-        for row, (key, (invalid_locales, group)) in enumerate(all_invalid_groups.items()):
-            self._key_to_row[key] = row
+        entries = list(all_invalid_groups.items())
+        self._populate_rows(entries, 0, EAGER_POPULATE_ROW_COUNT, display_locales, cell_styles)
+        if len(entries) > EAGER_POPULATE_ROW_COUNT:
+            pending = [entries, EAGER_POPULATE_ROW_COUNT, display_locales, cell_styles]
+            self._pending_rows = pending
+            QTimer.singleShot(0, lambda: self._populate_next_row_chunk(pending))
+
+    def _populate_next_row_chunk(self, pending):
+        """Build the next POPULATE_CHUNK_ROW_COUNT deferred rows, rescheduling until done."""
+        if pending is not self._pending_rows:
+            return  # flushed already, or replaced by a newer population
+        entries, start, display_locales, cell_styles = pending
+        stop = start + POPULATE_CHUNK_ROW_COUNT
+        self._with_table_updates_blocked(
+            lambda: self._populate_rows(
+                entries, start, stop, display_locales, cell_styles, keep_existing=True
+            ),
+            block_signals=True,
+        )
+        if stop < len(entries):
+            pending[1] = stop
+            QTimer.singleShot(0, lambda: self._populate_next_row_chunk(pending))
+        else:
+            self._pending_rows = None
+
+    def _flush_pending_rows(self):
+        """Build every row still waiting on _populate_next_row_chunk right now."""
+        pending = self._pending_rows
+        if pending is None:
+            return
+        self._pending_rows = None
+        entries, start, display_locales, cell_styles = pending
+        self._with_table_updates_blocked(
+            lambda: self._populate_rows(
+                entries, start, len(entries), display_locales, cell_styles, keep_existing=True
+            ),
+            block_signals=True,
+        )
+
+    def _populate_rows(self, entries, start, stop, display_locales, cell_styles, keep_existing=False):
+        """Create the table items for ``entries[start:stop]`` (rows ``start`` to ``stop - 1``).
+
+        With ``keep_existing``, locale cells that already hold an item (edited or filled while
+        the row was waiting to be built) are left as they are.
+        """
+        (
+            missing_brush,
+            critical_brush,
+            style_brush,
+            missing_text,
+            invalid_unicode_text,
+            invalid_indices_text,
+            invalid_braces_text,
+            invalid_leading_space_text,
+            invalid_newline_text,
+            invalid_character_set_text,
+        ) = cell_styles
+
+        for row in range(start, min(stop, len(entries))):
+            key, (invalid_locales, group) = entries[row]
             display_text = group.key.msgid
             msgid_item = QTableWidgetItem(display_text)
             msgid_item.setData(Qt.ItemDataRole.UserRole, key)
@@ -946,57 +1108,55 @@ class OutstandingItemsWindow(BaseTranslationWindow):
 
             self.table.setItem(row, 0, msgid_item)
 
+            # Per-row status sets, built once rather than re-read (and list-scanned) per column
+            missing = frozenset(invalid_locales.missing_locales)
+            invalid_unicode = frozenset(invalid_locales.invalid_unicode_locales)
+            invalid_index = frozenset(invalid_locales.invalid_index_locales)
+            invalid_brace = frozenset(invalid_locales.invalid_brace_locales)
+            invalid_leading_space = frozenset(invalid_locales.invalid_leading_space_locales)
+            invalid_newline = frozenset(invalid_locales.invalid_newline_locales)
+            invalid_character_set = frozenset(invalid_locales.invalid_character_set_locales)
+
             # Add translations for each locale (excluding default)
             for col, locale in enumerate(display_locales, 1):
+                if keep_existing and self.table.item(row, col) is not None:
+                    continue
                 item = QTableWidgetItem(group.get_translation_as_text(locale))
 
                 # Build tooltip text for invalid statuses
                 tooltip_parts = []
 
                 # Highlight problematic cells with custom colors
-                if locale in invalid_locales.missing_locales:
-                    item.setBackground(missing_color)
-                    tooltip_parts.append(TranslationStatus.MISSING.get_translated_value())
-
-                elif (locale in invalid_locales.invalid_unicode_locales or
-                      locale in invalid_locales.invalid_index_locales):
-                    item.setBackground(critical_color)
-                    if locale in invalid_locales.invalid_unicode_locales:
-                        tooltip_parts.append(TranslationStatus.INVALID_UNICODE.get_translated_value())
+                if locale in missing:
+                    item.setBackground(missing_brush)
+                    tooltip_parts.append(missing_text)
+
+                elif locale in invalid_unicode or locale in invalid_index:
+                    item.setBackground(critical_brush)
+                    if locale in invalid_unicode:
+                        tooltip_parts.append(invalid_unicode_text)
                     else:
-                        tooltip_parts.append(TranslationStatus.INVALID_INDICES.get_translated_value())
-
-                elif (locale in invalid_locales.invalid_brace_locales or
-                      locale in invalid_locales.invalid_leading_space_locales or
-                      locale in invalid_locales.invalid_newline_locales or
-                      locale in invalid_locales.invalid_character_set_locales):
-                    item.setBackground(style_color)
-                    if locale in invalid_locales.invalid_brace_locales:
-                        tooltip_parts.append(TranslationStatus.INVALID_BRACES.get_translated_value())
-                    if locale in invalid_locales.invalid_leading_space_locales:
-                        tooltip_parts.append(TranslationStatus.INVALID_LEADING_SPACE.get_translated_value())
-                    if locale in invalid_locales.invalid_newline_locales:
-                        tooltip_parts.append(TranslationStatus.INVALID_NEWLINE.get_translated_value())
-                    if locale in invalid_locales.invalid_character_set_locales:
-                        tooltip_parts.append(TranslationStatus.INVALID_CHARACTER_SET.get_translated_value())
+                        tooltip_parts.append(invalid_indices_text)
+
+                elif (locale in invalid_brace or
+                      locale in invalid_leading_space or
+                      locale in invalid_newline or
+                      locale in invalid_character_set):
+                    item.setBackground(style_brush)
+                    if locale in invalid_brace:
+                        tooltip_parts.append(invalid_braces_text)
+                    if locale in invalid_leading_space:
+                        tooltip_parts.append(invalid_leading_space_text)
+                    if locale in invalid_newline:
+                        tooltip_parts.append(invalid_newline_text)
+                    if locale in invalid_character_set:
+                        tooltip_parts.append(invalid_character_set_text)
 
                 if tooltip_parts:
                     item.setToolTip("\n".join(tooltip_parts))
 
                 self.table.setItem(row, col, item)
 
-        # Start every column at its minimum width; user can resize to make them wider
-        self.table.setColumnWidth(0, KEY_COLUMN_MIN_WIDTH)
-        for col in range(1, self.table.columnCount()):
-            self.table.setColumnWidth(col, OTHER_COLUMN_MIN_WIDTH)
-        self._min_key_column_width = KEY_COLUMN_MIN_WIDTH
-
-        # Return True only when there are rows to display.
-        has_items = len(all_invalid_groups) > 0
-        if not has_items:
-            logger.debug("No outstanding items found after load_data")
-        return has_items
-
     def save_changes(self):
         """Save changes to the translations."""
         try:
@@ -1015,8 +1175,8 @@ class OutstandingItemsWindow(BaseTranslationWindow):
                 if reply != QMessageBox.StandardButton.Yes:
                     return
 
-            # First, ensure translation service is cleaned up
-            if hasattr(self, 'translation_service'):
+            # First, ensure translation service is cleaned up if it was used since the last save
+            if self._translation_service_dirty and hasattr(self, 'translation_service'):
                 logger.debug("Cleaning up translation service...")
                 try:
                     if hasattr(self.translation_service, '_executor'):
@@ -1030,20 +1190,23 @@ class OutstandingItemsWindow(BaseTranslationWindow):
                     del self.translation_service
                     logger.debug("Reinitializing translation service...")
                     self.setup_translation_service(self.project_path)
+                    self._translation_service_dirty = False
                 except Exception as e:
                     logger.error(f"Error during translation service cleanup/reinitialization: {e}")
 
+            self._flush_pending_rows()
             logger.debug("Processing table changes...")
             logger.debug(f"Duplicate groups tracked: {len(self._prefill.outstanding_duplicate_groups)}")
 
             # Collect all changes first, grouped by locale
             changes_by_locale = {}
+            # Header locales are the same for every row, so read them once
+            col_locales = self._column_locales()
 
             for row in range(self.table.rowCount()):
                 key = self._get_key_from_row(row)
 
-                for col in range(1, self.table.columnCount()):
-                    locale = self.table.horizontalHeaderItem(col).text()
+                for col, locale in enumerate(col_locales, start=1):
                     item = self.table.item(row, col)
                     if item:
                         new_value = item.text()
@@ -1072,13 +1235,13 @@ class OutstandingItemsWindow(BaseTranslationWindow):
             self._prefill.clear_pending_prefill_changes()
             self._prefill.update_notice(self.prefill_notice_label)
 
+            # Receivers only record each batch and restart their own debounce timer, so the
+            # batches can be emitted back to back without pausing the GUI thread between locales.
             logger.debug(f"Emitting batches for {len(merged_changes_by_locale)} locales...")
-            for i, (locale, key_to_value) in enumerate(merged_changes_by_locale.items()):
+            for locale, key_to_value in merged_changes_by_locale.items():
                 changes = list(key_to_value.items())
                 logger.debug(f"Emitting batch of {len(changes)} updates for locale {locale}")
                 self.translation_updated.emit(locale, changes)
-                if i < len(merged_changes_by_locale) - 1:  # Don't sleep after the last one
-                    QThread.msleep(100)  # 100ms delay between locales
 
             # If this save contains only key deletions (no text edits), flush queued deletions now.
             parent = self.parent()
@@ -1091,7 +1254,9 @@ class OutstandingItemsWindow(BaseTranslationWindow):
                 return
 
             # Fallback path when parent cannot process updates: keep previous in-window behavior.
-            has_items = self.load_data(self.translations, self.locales, skip_duplicate_prompt=True)
+            has_items = self.load_data(
+                self.translations, self.locales, skip_duplicate_prompt=True, defer_if_hidden=True
+            )
             if not has_items:
                 logger.debug("No remaining outstanding translations; closing window.")
                 self.close()
@@ -1105,28 +1270,36 @@ class OutstandingItemsWindow(BaseTranslationWindow):
         if not hasattr(self, 'translations'):
             return
 
-        for row in range(self.table.rowCount()):
-            key = self._get_key_from_row(row)
-            for col in range(1, self.table.columnCount()):
-                locale = self.table.horizontalHeaderItem(col).text()
+        self._flush_pending_rows()
+        col_locales = self._column_locales()
+
+        def apply_display_mode():
+            for row, key in enumerate(self._row_keys):
                 group = self.translations.get(key)
-                if group:
+                if not group:
+                    continue
+                as_text = (
+                    group.get_translation_escaped_as_text
+                    if self.show_escaped
+                    else group.get_translation_unescaped_as_text
+                )
+                for col, locale in enumerate(col_locales, start=1):
+                    # Cells with no stored translation keep whatever the user has typed
                     if group.get_translation(locale):
                         item = self.table.item(row, col)
                         if item:
-                            txt = (
-                                group.get_translation_escaped_as_text(locale)
-                                if self.show_escaped
-                                else group.get_translation_unescaped_as_text(locale)
-                            )
-                            item.setText(txt)
+                            # Plain-ASCII values render the same in both modes; leave those alone
+                            text = as_text(locale)
+                            if item.text() != text:
+                                item.setText(text)
+
+        self._with_cell_text_batched(apply_display_mode)
 
     def toggle_unicode_display(self):
         """Toggle the Unicode display mode."""
         self.show_escaped = not self.show_escaped
         self.update_table_display()
-        # Force UI update
-        QTimer.singleShot(0, lambda: self.table.viewport().update())
+        self._schedule_viewport_update()
 
     def fill_all_cells_with_random_strings(self):
         """Fill all translation cells with random strings for testing purposes.
@@ -1136,31 +1309,28 @@ class OutstandingItemsWindow(BaseTranslationWindow):
         """
         if not hasattr(self, 'table') or self.table.rowCount() == 0:
             return
+        self._flush_pending_rows()
 
-        def generate_random_string(length=6):
-            """Generate a random string of given length (default 6 chars)."""
-            # Use letters and digits only for the random part
-            chars = string.ascii_lowercase + string.digits
-            return ''.join(random.choice(chars) for _ in range(length))
-
+        col_locales = self._column_locales()
         filled_count = 0
-        for row in range(self.table.rowCount()):
-            # Generate one random part per row (so duplicate groups get the same value when saved)
-            random_part = generate_random_string()
 
-            for col in range(1, self.table.columnCount()):  # Skip column 0 (key column)
-                item = self.table.item(row, col)
-                if item:
-                    # Get locale for this column
-                    locale = self.table.horizontalHeaderItem(col).text()
+        def fill_cells():
+            nonlocal filled_count
+            for row in range(self.table.rowCount()):
+                # Generate one random part per row (so duplicate groups get the same value when saved)
+                random_part = secrets.token_hex(3)  # 6 lowercase hex chars
+
+                for col, locale in enumerate(col_locales, start=1):  # Skip column 0 (key column)
+                    item = self.table.item(row, col)
+                    if item:
+                        # Format: {locale}_{row_index}_{random_string}
+                        # Same row index for all locales in this row (ensures duplicate groups match)
+                        # Same random part for all locales in this row (ensures duplicate groups match)
+                        test_string = f"{locale}_{row}_{random_part}"
+                        item.setText(test_string)
+                        filled_count += 1
 
-                    # Format: {locale}_{row_index}_{random_string}
-                    # Same row index for all locales in this row (ensures duplicate groups match)
-                    # Same random part for all locales in this row (ensures duplicate groups match)
-                    test_string = f"{locale}_{row}_{random_part}"
-                    item.setText(test_string)
-                    filled_count += 1
+        self._with_cell_text_batched(fill_cells)
 
         logger.debug(f"Filled {filled_count} cells with random strings (F5 pressed)")
-        # Force UI update
-        QTimer.singleShot(0, lambda: self.table.viewport().update())
+        self._schedule_viewport_update()
@@ -313,7 +313,7 @@ class QualityHeuristicKind(str, Enum):
 
 
 # Common ISO 639-1 language codes
-valid_language_codes = {
+valid_language_codes = frozenset({
     # A
     'aa',  # Afar
     'ab',  # Abkhazian
@@ -545,7 +545,7 @@ valid_language_codes = {
     # Z
     'za',  # Zhuang; Chuang
     'zu'   # Zulu
-}
+})
 
 # Language codes shown in the locale picker when no cross-project locale history exists.
 FALLBACK_SUGGESTED_LANGUAGE_CODES = (
@@ -563,7 +563,7 @@ FALLBACK_SUGGESTED_LANGUAGE_CODES = (
 
 
 # Common ISO 3166-1 country codes
-valid_country_codes = {
+valid_country_codes = frozenset({
     # A
     'AF',  # Afghanistan
     'AX',  # Åland Islands
@@ -862,13 +862,13 @@ valid_country_codes = {
     # Z
     'ZM',  # Zambia
     'ZW'   # Zimbabwe
-}
+})
 
 
 # Common script codes
-valid_script_codes = {
+valid_script_codes = frozenset({
     'Arab', 'Armn', 'Beng', 'Cans', 'Cher', 'Cyrl', 'Deva', 'Ethi', 'Geor', 'Grek', 'Gujr', 
     'Guru', 'Hang', 'Hani', 'Hans', 'Hant', 'Hebr', 'Hira', 'Jpan', 'Kana', 'Khmr', 'Knda', 
     'Kore', 'Laoo', 'Latn', 'Mlym', 'Mong', 'Mymr', 'Orya', 'Sinh', 'Taml', 'Telu', 'Thai', 
     'Tibt', 'Yiii', 'Zyyy', 'Zzzz'
-}
+})
@@ -297,6 +297,21 @@ class SettingsManager:
             key (str): Setting key to save
             value (Any): Value to save
             
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        return self.save_project_settings(project_path, {key: value})
+        
+    def save_project_settings(self, project_path: str, values: dict[str, Any],
+                              intro_details: Optional[dict[str, str]] = None) -> bool:
+        """Save several project-specific settings with a single read/write of the settings file.
+        
+        Args:
+            project_path (str): Path to the project
+            values (dict): Setting keys mapped to the values to save
+            intro_details (dict, optional): Intro details to store in the same write, as
+                save_intro_details would
+            
         Returns:
             bool: True if successful, False otherwise
         """
@@ -314,8 +329,10 @@ class SettingsManager:
             if project_path not in settings['project_settings']:
                 settings['project_settings'][project_path] = {}
                 
-            # Save the setting
-            settings['project_settings'][project_path][key] = value
+            # Save the settings
+            settings['project_settings'][project_path].update(values)
+            if intro_details is not None:
+                settings['intro_details'] = intro_details
             
             with open(self.settings_file, 'w') as f:
                 json.dump(settings, f, indent=4)
@@ -323,7 +340,7 @@ class SettingsManager:
             return True
             
         except Exception as e:
-            logger.error(f"Error saving project setting {key} for {project_path}: {e}")
+            logger.error(f"Error saving project settings {', '.join(values)} for {project_path}: {e}")
             return False
             
     def get_project_default_locale(self, project_path: str) -> str:
@@ -72,6 +72,10 @@ class TranslationWorker(QThread):
             # Run the translation management task with the specified action
             result = self.manager.manage_translations(self.action, set(self.pending_updates.keys()))
 
+            # Count here, off the UI thread, so the stats widget only reads cached values
+            if result.invalid_groups:
+                result.invalid_groups.compute_counts()
+
             # Emit statistics and translations data
             self.stats_updated.emit(result)
             self.translations_ready.emit(self.manager.translations, self.manager.locales)